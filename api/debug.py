@@ -6,7 +6,7 @@ from fastapi import APIRouter, HTTPException
 from bus.signal_bus import fetch_recent_signals
 from bus.signal_bus import publish_signal, publish_cross_signal
 from observability.metrics import (
-    zk_dominant_frequency_hz,
+    ZK_FREQ,
     zk_wavelet_urgency_score,
     zk_flow_confidence_score,
 )
@@ -117,8 +117,8 @@ async def trigger_test_event() -> Dict[str, Any]:
 
 @router.get("/debug/macro_status")
 async def macro_status() -> Dict[str, Any]:
-    es_freq = float(zk_dominant_frequency_hz.labels(source="macro_es")._value.get())
-    nq_freq = float(zk_dominant_frequency_hz.labels(source="macro_nq")._value.get())
+    es_freq = float(ZK_FREQ["macro_es"]._value.get())
+    nq_freq = float(ZK_FREQ["macro_nq"]._value.get())
     es_urg = float(zk_wavelet_urgency_score.labels(source="macro_es")._value.get())
     nq_urg = float(zk_wavelet_urgency_score.labels(source="macro_nq")._value.get())
     macro_conf = float(zk_flow_confidence_score.labels(protocol="macro")._value.get())
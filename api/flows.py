@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from fastapi import APIRouter, Query
 
@@ -14,6 +14,12 @@ _ETH_WALLETS = {w["address"].lower() for w in KNOWN_WALLETS if w["chain"] == "et
 _XRPL_WALLETS = {w["address"].lower() for w in KNOWN_WALLETS if w["chain"] == "xrpl"}
 _WALLET_LABELS = {w["address"].lower(): w["label"] for w in KNOWN_WALLETS}
 _WALLET_ENTITIES = {w["address"].lower(): w["entity"] for w in KNOWN_WALLETS}
+_ALL_KNOWN_WALLETS = frozenset(_ETH_WALLETS | _XRPL_WALLETS)
+_entity_addrs: Dict[str, set] = {}
+for _w in KNOWN_WALLETS:
+    _entity_addrs.setdefault(_w["entity"], set()).add(_w["address"].lower())
+_ENTITY_WALLETS: Dict[str, FrozenSet[str]] = {k: frozenset(v) for k, v in _entity_addrs.items()}
+del _entity_addrs, _w
 
 
 @router.get("/flows")
@@ -40,16 +46,16 @@ async def list_flows(
     tx_norm = (tx_hash or "").strip().lower() if tx_hash else None
     
     # Build wallet filter set
-    wallet_filter_addrs: set = set()
+    wallet_filter_addrs: FrozenSet[str] = frozenset()
     if wallet:
         wallet_lower = wallet.strip().lower()
         # Check if it's an entity name
         if wallet_lower in ["binance", "ripple", "gsr", "cumberland", "wintermute", "coinbase", "kraken", "alameda", "bitstamp"]:
-            wallet_filter_addrs = {w["address"].lower() for w in KNOWN_WALLETS if w["entity"] == wallet_lower}
+            wallet_filter_addrs = _ENTITY_WALLETS.get(wallet_lower, frozenset())
         else:
-            wallet_filter_addrs = {wallet_lower}
+            wallet_filter_addrs = frozenset((wallet_lower,))
     if entity:
-        entity_addrs = {w["address"].lower() for w in KNOWN_WALLETS if w["entity"] == entity.strip().lower()}
+        entity_addrs = _ENTITY_WALLETS.get(entity.strip().lower(), frozenset())
         if wallet_filter_addrs:
             wallet_filter_addrs = wallet_filter_addrs.intersection(entity_addrs)
         else:
@@ -81,8 +87,7 @@ async def list_flows(
                 if from_addr not in wallet_filter_addrs and to_addr not in wallet_filter_addrs:
                     continue
             elif institutional_only:
-                all_known = _ETH_WALLETS | _XRPL_WALLETS
-                if from_addr not in all_known and to_addr not in all_known:
+                if from_addr not in _ALL_KNOWN_WALLETS and to_addr not in _ALL_KNOWN_WALLETS:
                     continue
             
             # Annotate with institutional labels
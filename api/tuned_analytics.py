@@ -3,48 +3,88 @@ API endpoints for fine-tuned analytics with HMM, Fourier, and Prophet
 """
 
 from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
-from typing import Optional, List, Dict, Any
+from fastapi.responses import ORJSONResponse
+from typing import Optional, List, Dict, Any, Tuple
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial, wraps
+from io import StringIO
+from types import MappingProxyType
 import asyncio
+import hashlib
 import logging
+import multiprocessing
+import secrets
+import time
+
+import httpx
+import orjson
 
 # Import our tuned predictors
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ml.fourier_markov_prophet import FourierMarkovProphetIntegrator
+from ml.fourier_markov_prophet import predict_multi_asset_flows_sync
 from ml.hmm_flow_predictor import DarkFlowHMM
 from ml.fourier_flow_analyzer import FourierFlowAnalyzer
 from ml.prophet_flow_tuner import TunedProphetForecaster
 from ml.smart_flow_forecaster import SmartFlowForecaster
+from ml.hmm_features_nb import build_features, warmup as warmup_hmm_features
 
 # Import data fetchers
 from app.config import (
-    POLYGON_API_KEY, FINNHUB_API_KEY, ALPHA_VANTAGE_API_KEY,
+    POLYGON_API_KEY, FINNHUB_API_KEY, ALPHA_VANTAGE_API_KEY, ALPHA_VANTAGE_RPM,
     REDIS_URL, COINGECKO_API_KEY
 )
+from app.redis_utils import get_redis, REDIS_ENABLED
+from utils.rate_limit import AsyncTokenBucket
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/analytics", tags=["tuned_analytics"])
+router = APIRouter(prefix="/analytics", tags=["tuned_analytics"], default_response_class=ORJSONResponse)
+
+# Assets consumed by FourierMarkovProphetIntegrator.predict_multi_asset_flows
+INTEGRATED_ASSETS = ("xrp", "btc", "eth", "spy")
 
-# Initialize predictors (singleton pattern)
-integrator = None
+# Initialize predictors (singleton pattern); the integrator runs only in the
+# prediction process pool (see run_integrated_prediction)
 hmm_model = None
 fourier_analyzer = None
 prophet_forecaster = None
 smart_forecaster = None
 
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _f32(series: pd.Series) -> np.ndarray:
+    """float32 array for FFT/correlation paths (Prophet inputs stay float64)"""
+    return series.to_numpy(dtype=np.float32, copy=False)
+
+
+# Shared HTTP client for upstream market-data fetches (keep-alive reuse, HTTP/2 multiplexing)
+_http_client: Optional[httpx.AsyncClient] = None
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=40, keepalive_expiry=30)
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
 
-def get_integrator():
-    """Get or create integrator instance"""
-    global integrator
-    if integrator is None:
-        integrator = FourierMarkovProphetIntegrator()
-    return integrator
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared pooled HTTP client"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, http2=True)
+    return _http_client
+
+
+async def _close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 
 def get_hmm_model():
@@ -79,97 +119,358 @@ def get_smart_forecaster():
     return smart_forecaster
 
 
-async def fetch_asset_data(asset: str, period: str = "1d") -> pd.DataFrame:
+async def _warmup_kernels() -> None:
+    """Compile JIT kernels off the event loop before the first /forecast or /flow_state"""
+    try:
+        await asyncio.to_thread(warmup_hmm_features)
+    except Exception as e:
+        logger.warning(f"Kernel warmup failed: {e}")
+
+
+# Integrated prediction runs in worker processes so model fits don't block the event loop
+PREDICT_POOL_WORKERS = os.cpu_count() or 1
+_predict_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_predict_pool() -> ProcessPoolExecutor:
+    """Get or create the process pool for integrated predictions"""
+    global _predict_pool
+    if _predict_pool is None:
+        try:
+            ctx = multiprocessing.get_context("forkserver")
+        except ValueError:
+            ctx = multiprocessing.get_context("spawn")
+        _predict_pool = ProcessPoolExecutor(max_workers=PREDICT_POOL_WORKERS, mp_context=ctx)
+    return _predict_pool
+
+
+async def _shutdown_predict_pool() -> None:
+    global _predict_pool
+    if _predict_pool is not None:
+        _predict_pool.shutdown(wait=False, cancel_futures=True)
+        _predict_pool = None
+
+
+async def run_integrated_prediction(data: Dict[str, pd.DataFrame], horizon: int) -> Dict:
+    """Run predict_multi_asset_flows for INTEGRATED_ASSETS in the process pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_predict_pool(),
+        partial(
+            predict_multi_asset_flows_sync,
+            **{f"{a}_data": data[a] for a in INTEGRATED_ASSETS},
+            forecast_horizon=horizon
+        )
+    )
+
+
+# Fitted HMM cache: (venue, window, feature digest) -> (means, covs, states, prob)
+HMM_FIT_CACHE_SIZE = 64
+HMM_FIT_CACHE_TTL = 300
+_hmm_fit_cache: "OrderedDict[Tuple[str, int, str], tuple]" = OrderedDict()
+
+
+async def fit_decode_hmm(hmm: DarkFlowHMM, features: np.ndarray, venue: str, window: int) -> Tuple[List[int], float]:
     """
-    Fetch REAL asset data from Alpha Vantage or database
-    NO MOCK DATA - EVER!
+    Fit emissions and Viterbi-decode, reusing a previous fit for identical features.
+    Checks the in-process LRU first, then Redis (shared across workers).
     """
-    import httpx
-    from db.connection import get_async_session
-    from sqlalchemy import text
-    
-    # Map assets to symbols
-    symbol_map = {
-        'xrp': 'XRP',
-        'btc': 'BTC', 
-        'eth': 'ETH',
-        'spy': 'SPY',
-        'qqq': 'QQQ'
-    }
-    
-    symbol = symbol_map.get(asset.lower(), asset.upper())
+    features = np.ascontiguousarray(features)
+    digest = hashlib.blake2b(features.tobytes(), digest_size=16)
+    digest.update(str(features.shape).encode())
+    key = (venue.lower(), window, digest.hexdigest())
+    redis_key = "hmm:fit:{}:{}:{}".format(*key)
+
+    cached = _hmm_fit_cache.get(key)
+    if cached is not None:
+        _hmm_fit_cache.move_to_end(key)
+    elif REDIS_ENABLED:
+        try:
+            r = await get_redis()
+            blob = await r.get(redis_key)
+            if blob:
+                data = orjson.loads(blob)
+                cached = (np.array(data["means"]), np.array(data["covs"]), data["states"], data["prob"])
+        except Exception as e:
+            logger.warning(f"HMM cache read failed for {redis_key}: {e}")
+
+    if cached is None:
+        hmm.fit_gaussian_mixtures(features)
+        states, prob = hmm.viterbi_decode(features)
+        cached = (hmm.emission_means, hmm.emission_covs, [int(s) for s in states], float(prob))
+        if REDIS_ENABLED:
+            try:
+                r = await get_redis()
+                blob = orjson.dumps(
+                    {"means": cached[0], "covs": cached[1], "states": cached[2], "prob": cached[3]},
+                    option=orjson.OPT_SERIALIZE_NUMPY,
+                )
+                await r.set(redis_key, blob, ex=HMM_FIT_CACHE_TTL)
+            except Exception as e:
+                logger.warning(f"HMM cache write failed for {redis_key}: {e}")
+
+    _hmm_fit_cache[key] = cached
+    if len(_hmm_fit_cache) > HMM_FIT_CACHE_SIZE:
+        _hmm_fit_cache.popitem(last=False)
+
+    means, covs, states, prob = cached
+    hmm.emission_means = means
+    hmm.emission_covs = covs
+    return list(states), prob
+
+
+# Asset data cache (cache-aside in Redis, shared across workers)
+ASSET_CACHE_TTL_INTRADAY = 300
+ASSET_CACHE_TTL_DAILY = 3600
+ASSET_CACHE_LOCK_MS = 5000
+
+
+def _asset_cache_ttl(period: str) -> int:
+    """Intraday periods (e.g. 5m, 1h) expire faster than daily bars"""
+    return ASSET_CACHE_TTL_INTRADAY if period.endswith(("m", "h")) else ASSET_CACHE_TTL_DAILY
+
+
+# Deletes the fill lock only if it still holds this caller's token, so a caller
+# whose lock already expired can't release a lock another worker now owns
+_RELEASE_LOCK_LUA = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def _redis_memoize_asset(fetch):
+    """
+    Memoize an asset fetcher in Redis keyed by (asset, period).
+    A short NX lock keeps concurrent misses from stampeding the upstream API.
+    """
+    @wraps(fetch)
+    async def wrapper(asset: str, period: str = "1d") -> pd.DataFrame:
+        if not REDIS_ENABLED:
+            return await fetch(asset, period)
+
+        key = f"asset:{asset.lower()}:{period}"
+        lock_key = f"{key}:lock"
+        r = None
+        token = None  # set only while this call holds the fill lock
+        try:
+            r = await get_redis()
+            blob = await r.get(key)
+            if blob is None:
+                candidate = secrets.token_hex(8)
+                deadline = time.monotonic() + ASSET_CACHE_LOCK_MS / 1000
+                while True:
+                    if await r.set(lock_key, candidate, nx=True, px=ASSET_CACHE_LOCK_MS):
+                        token = candidate
+                        break
+                    if time.monotonic() >= deadline:
+                        logger.warning(f"Asset cache lock wait timed out for {key}")
+                        break
+                    # Another worker is fetching this asset - wait for it to fill the cache,
+                    # or take the lock over if it gives up without filling it
+                    await asyncio.sleep(0.1)
+                    blob = await r.get(key)
+                    if blob is not None:
+                        break
+            if blob is not None:
+                df = pd.read_json(StringIO(blob), orient="split", dtype=False)
+                df.index.name = "timestamp"
+                return df
+        except Exception as e:
+            logger.warning(f"Asset cache read failed for {key}: {e}")
+
+        try:
+            df = await fetch(asset, period)
+            if r is not None and not df.empty:
+                try:
+                    await r.set(key, df.to_json(orient="split", date_format="iso"), ex=_asset_cache_ttl(period))
+                except Exception as e:
+                    logger.warning(f"Asset cache write failed for {key}: {e}")
+            return df
+        finally:
+            if token is not None:
+                try:
+                    await r.eval(_RELEASE_LOCK_LUA, 1, lock_key, token)
+                except Exception as e:
+                    logger.warning(f"Asset cache lock release failed for {key}: {e}")
+
+    return wrapper
+
+
+# Asset -> market symbol, and Alpha Vantage endpoint templates
+_SYMBOL_MAP = MappingProxyType({
+    'xrp': 'XRP',
+    'btc': 'BTC',
+    'eth': 'ETH',
+    'spy': 'SPY',
+    'qqq': 'QQQ'
+})
+_CRYPTO_ASSETS = frozenset({'btc', 'eth', 'xrp'})
+_AV_CRYPTO_URL = "https://www.alphavantage.co/query?function=DIGITAL_CURRENCY_DAILY&symbol={symbol}&market=USD&apikey={apikey}"
+_AV_STOCK_URL = "https://www.alphavantage.co/query?function=TIME_SERIES_DAILY&symbol={symbol}&apikey={apikey}"
+
+# Client-side Alpha Vantage quota (shared by all fetches in this worker)
+AV_MAX_RETRIES = 3
+AV_BACKOFF_BASE_SECONDS = 2.0
+_av_limiter = AsyncTokenBucket(ALPHA_VANTAGE_RPM, 60.0)
+
+
+async def _alpha_vantage_get(url: str) -> Dict[str, Any]:
+    """
+    Rate-limited Alpha Vantage GET. Throttled responses (429/503, or the free
+    tier's in-band 'Note'/'Information' message) back off and retry instead of
+    being parsed as data.
+    """
+    for attempt in range(AV_MAX_RETRIES + 1):
+        await _av_limiter.acquire()
+        response = await get_http_client().get(url)
+        
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            _av_limiter.penalize()
+        
+        if response.status_code not in (429, 503):
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            if 'Note' not in data and 'Information' not in data:
+                return data
+        
+        if attempt == AV_MAX_RETRIES:
+            break
+        
+        retry_after = response.headers.get('Retry-After', '')
+        wait = float(retry_after) if retry_after.isdigit() else AV_BACKOFF_BASE_SECONDS * 2 ** attempt
+        logger.warning(f"Alpha Vantage throttled (status {response.status_code}), retrying in {wait:.0f}s")
+        _av_limiter.penalize(wait)
     
-    # First try to get from database (historical signals)
+    raise ValueError("Alpha Vantage rate limit exceeded")
+
+
+# Alpha Vantage field names per output column, in order of preference
+_AV_COLUMNS = (
+    ('open', ('1. open', '1a. open (USD)')),
+    ('high', ('2. high', '2a. high (USD)')),
+    ('low', ('3. low', '3a. low (USD)')),
+    ('close', ('4. close', '4a. close (USD)')),
+    ('volume', ('5. volume', '6. market cap (USD)')),
+)
+
+
+def _parse_alpha_vantage_series(ts: Dict[str, Dict[str, str]]) -> pd.DataFrame:
+    """
+    Build an OHLCV frame from an Alpha Vantage time series block.
+    Each column is converted in one numpy pass instead of per-cell astype.
+    """
+    rows = list(ts.values())
+    sample = rows[0] if rows else {}
+    columns = {}
+    for name, candidates in _AV_COLUMNS:
+        field = next((c for c in candidates if c in sample), None)
+        if field is None:
+            raise ValueError(f"Missing '{name}' column in Alpha Vantage response")
+        columns[name] = np.array([row[field] for row in rows], dtype=np.float64)
+
+    index = pd.DatetimeIndex(np.array(list(ts), dtype='datetime64[ns]'), name='timestamp')
+    return pd.DataFrame(columns, index=index)
+
+
+# Signal-derived OHLCV bars, newest 500 per network in one round-trip.
+# Runs through the shared asyncpg pool, which caches the prepared statement per connection.
+_SIGNAL_BARS_QUERY = """
+    SELECT timestamp, close, low, high, open, volume, network
+    FROM (
+        SELECT
+            detected_at as timestamp,
+            confidence as close,
+            confidence * 0.98 as low,
+            confidence * 1.02 as high,
+            confidence as open,
+            COALESCE(amount_usd, 1000000) as volume,
+            network,
+            ROW_NUMBER() OVER (PARTITION BY network ORDER BY detected_at DESC) as rn
+        FROM signals
+        WHERE network = ANY($1::text[])
+        AND detected_at > NOW() - INTERVAL '30 days'
+    ) ranked
+    WHERE rn <= 500
+"""
+_SIGNAL_BAR_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def _asset_network(asset: str) -> str:
+    """Signals table network that stands in for an asset's history"""
+    return 'xrpl' if asset.lower() == 'xrp' else 'ethereum'
+
+
+async def fetch_signal_bars(networks: List[str]) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch signal-derived bars for several networks with a single query.
+    Networks without recent signals are omitted from the result.
+    """
+    from db.connection import fetch
+
     try:
-        async with get_async_session() as session:
-            query = text("""
-                SELECT 
-                    detected_at as timestamp,
-                    confidence as close,
-                    confidence * 0.98 as low,
-                    confidence * 1.02 as high,
-                    confidence as open,
-                    COALESCE(amount_usd, 1000000) as volume
-                FROM signals 
-                WHERE network = :network
-                AND detected_at > NOW() - INTERVAL '30 days'
-                ORDER BY detected_at DESC
-                LIMIT 500
-            """)
-            
-            network = 'xrpl' if asset.lower() == 'xrp' else 'ethereum'
-            result = await session.execute(query, {'network': network})
-            rows = result.fetchall()
-            
-            if rows:
-                df = pd.DataFrame(rows, columns=['timestamp', 'close', 'low', 'high', 'open', 'volume'])
-                df.set_index('timestamp', inplace=True)
-                return df
+        rows = await fetch(_SIGNAL_BARS_QUERY, sorted(set(networks)))
     except Exception as e:
         logger.warning(f"Database fetch failed: {e}")
+        return {}
+
+    if not rows:
+        return {}
+
+    df = pd.DataFrame([dict(r) for r in rows])
+    df[_SIGNAL_BAR_COLUMNS] = df[_SIGNAL_BAR_COLUMNS].astype(np.float64)
+    df.set_index('timestamp', inplace=True)
+    return {
+        network: group[_SIGNAL_BAR_COLUMNS].sort_index()
+        for network, group in df.groupby('network', sort=False)
+    }
+
+
+async def fetch_assets_data(assets: List[str], period: str = "1d") -> Dict[str, pd.DataFrame]:
+    """
+    Fetch several assets at once: one database round-trip covers every
+    network, and only assets without signal history fall back to Alpha Vantage.
+    """
+    frames = await fetch_signal_bars([_asset_network(a) for a in assets])
+    result = {a: frames[_asset_network(a)] for a in assets if _asset_network(a) in frames}
+
+    missing = [a for a in assets if a not in result]
+    if missing:
+        # The batch query already found no signal history for these; skip the re-query
+        fetched = await asyncio.gather(*(fetch_market_data(a, period) for a in missing))
+        result.update(zip(missing, fetched))
+    return result
+
+
+async def _alpha_vantage_bars(asset: str, period: str = "1d") -> pd.DataFrame:
+    """
+    Fetch REAL asset data from Alpha Vantage only (no signal-history lookup)
+    NO MOCK DATA - EVER!
+    """
+    asset_key = asset.lower()
+    symbol = _SYMBOL_MAP.get(asset_key, asset.upper())
     
-    # Fallback to Alpha Vantage for market data
     if ALPHA_VANTAGE_API_KEY:
         try:
-            async with httpx.AsyncClient() as client:
-                # Crypto or stock endpoint
-                if asset.lower() in ['btc', 'eth', 'xrp']:
-                    url = f"https://www.alphavantage.co/query?function=DIGITAL_CURRENCY_DAILY&symbol={symbol}&market=USD&apikey={ALPHA_VANTAGE_API_KEY}"
-                else:
-                    url = f"https://www.alphavantage.co/query?function=TIME_SERIES_DAILY&symbol={symbol}&apikey={ALPHA_VANTAGE_API_KEY}"
-                
-                response = await client.get(url, timeout=30)
-                data = response.json()
-                
-                # Parse Alpha Vantage response
-                if 'Time Series (Digital Currency Daily)' in data:
-                    ts = data['Time Series (Digital Currency Daily)']
-                elif 'Time Series (Daily)' in data:
-                    ts = data['Time Series (Daily)']
-                else:
-                    raise ValueError(f"No data found for {symbol}")
-                
-                # Convert to DataFrame
-                df = pd.DataFrame.from_dict(ts, orient='index')
-                df.index = pd.to_datetime(df.index)
-                df.index.name = 'timestamp'
-                
-                # Rename columns
-                col_map = {
-                    '1. open': 'open', '1a. open (USD)': 'open',
-                    '2. high': 'high', '2a. high (USD)': 'high',
-                    '3. low': 'low', '3a. low (USD)': 'low',
-                    '4. close': 'close', '4a. close (USD)': 'close',
-                    '5. volume': 'volume', '6. market cap (USD)': 'volume'
-                }
-                df.rename(columns=col_map, inplace=True)
-                
-                # Select and convert columns
-                df = df[['open', 'high', 'low', 'close', 'volume']]
-                df = df.astype(float)
-                
-                return df.sort_index()
-                
+            # Crypto or stock endpoint
+            url_template = _AV_CRYPTO_URL if asset_key in _CRYPTO_ASSETS else _AV_STOCK_URL
+            url = url_template.format(symbol=symbol, apikey=ALPHA_VANTAGE_API_KEY)
+            
+            data = await _alpha_vantage_get(url)
+            
+            # Parse Alpha Vantage response
+            if 'Time Series (Digital Currency Daily)' in data:
+                ts = data['Time Series (Digital Currency Daily)']
+            elif 'Time Series (Daily)' in data:
+                ts = data['Time Series (Daily)']
+            else:
+                raise ValueError(f"No data found for {symbol}")
+            
+            df = _parse_alpha_vantage_series(ts)
+            
+            return df.sort_index()
+            
         except Exception as e:
             logger.error(f"Alpha Vantage fetch failed: {e}")
     
@@ -178,6 +479,26 @@ async def fetch_asset_data(asset: str, period: str = "1d") -> pd.DataFrame:
     return pd.DataFrame()  # Empty - no fake data!
 
 
+# For assets already known to have no signal history (see fetch_assets_data)
+fetch_market_data = _redis_memoize_asset(_alpha_vantage_bars)
+
+
+@_redis_memoize_asset
+async def fetch_asset_data(asset: str, period: str = "1d") -> pd.DataFrame:
+    """
+    Fetch REAL asset data from Alpha Vantage or database
+    NO MOCK DATA - EVER!
+    """
+    # First try to get from database (historical signals)
+    network = _asset_network(asset.lower())
+    frames = await fetch_signal_bars([network])
+    if network in frames:
+        return frames[network]
+    
+    # Fallback to Alpha Vantage for market data
+    return await _alpha_vantage_bars(asset, period)
+
+
 @router.get("/forecast")
 async def get_tuned_forecast(
     asset: str = Query("xrp", description="Asset to forecast"),
@@ -196,27 +517,20 @@ async def get_tuned_forecast(
         # Prepare Prophet format
         df_prophet = pd.DataFrame({
             'ds': asset_data.index,
-            'y': asset_data['close'].values
+            'y': asset_data['close'].to_numpy(copy=False)
         })
         
         # Apply tuning based on parameter
         if tune == "all" or tune is None:
             # Use integrated predictor
-            integrator = get_integrator()
+            # Fetch correlated assets, reusing the requested asset's data
+            data = {asset.lower(): asset_data}
+            data.update(await fetch_assets_data(
+                [a for a in INTEGRATED_ASSETS if a not in data]
+            ))
             
-            # Fetch correlated assets
-            btc_data = await fetch_asset_data("btc")
-            eth_data = await fetch_asset_data("eth")
-            spy_data = await fetch_asset_data("spy")
-            
-            # Run integrated prediction
-            results = await integrator.predict_multi_asset_flows(
-                xrp_data=asset_data if asset.lower() == "xrp" else await fetch_asset_data("xrp"),
-                btc_data=btc_data,
-                eth_data=eth_data,
-                spy_data=spy_data,
-                forecast_horizon=horizon
-            )
+            # Run integrated prediction (off the event loop)
+            results = await run_integrated_prediction(data, horizon)
             
             # Extract predictions for requested asset
             asset_predictions = [
@@ -251,27 +565,19 @@ async def get_tuned_forecast(
             hmm = get_hmm_model()
             
             # Extract features
-            features = np.column_stack([
-                asset_data['volume'].values / asset_data['volume'].mean(),
-                asset_data['close'].pct_change().fillna(0).values,
-                asset_data['close'].pct_change().rolling(20).std().fillna(0).values,
-            ])
+            features = build_features(
+                asset_data['volume'].to_numpy(),
+                asset_data['close'].to_numpy(),
+            )
             
-            # Fit and predict
-            hmm.fit_gaussian_mixtures(features)
-            states, prob = hmm.viterbi_decode(features)
+            # Fit and predict (reuses a cached fit for an unchanged window)
+            states, prob = await fit_decode_hmm(hmm, features, asset, len(features))
             
             # Predict next states
-            future_states = []
-            current_state = states[-1]
-            state_history = states[-10:]
-            
-            for _ in range(horizon):
-                next_probs = hmm.predict_next_state(current_state, state_history)
-                next_state = max(next_probs, key=next_probs.get)
-                future_states.append(next_state)
-                state_history.append(list(hmm.state_names).index(next_state))
-                current_state = list(hmm.state_names).index(next_state)
+            future_states = [
+                hmm.state_names[s]
+                for s in hmm.forecast_states(states[-1], states[-10:], horizon)
+            ]
             
             return {
                 "asset": asset,
@@ -288,7 +594,7 @@ async def get_tuned_forecast(
             fourier = get_fourier_analyzer()
             
             # Extract frequency features
-            prices = asset_data['close'].values
+            prices = _f32(asset_data['close'])
             features = fourier.extract_frequency_features(prices)
             
             # Detect patterns
@@ -332,18 +638,32 @@ async def get_tuned_forecast(
                 use_optimized=True
             )
             
+            # Columnar extraction - no per-row Series materialization
+            tail = forecast.tail(horizon)
+            if 'confidence_score' in tail:
+                confidence = tail['confidence_score'].tolist()
+            else:
+                confidence = [0.5] * len(tail)
+            
             return {
                 "asset": asset,
                 "forecast": [
                     {
-                        "timestamp": row['ds'].isoformat(),
-                        "prediction": row['yhat'],
-                        "lower": row['yhat_lower'],
-                        "upper": row['yhat_upper'],
-                        "trend": row['trend'],
-                        "confidence": row.get('confidence_score', 0.5)
+                        "timestamp": ts.isoformat(),
+                        "prediction": yhat,
+                        "lower": lower,
+                        "upper": upper,
+                        "trend": trend,
+                        "confidence": conf
                     }
-                    for _, row in forecast.tail(horizon).iterrows()
+                    for ts, yhat, lower, upper, trend, conf in zip(
+                        tail['ds'],
+                        tail['yhat'].tolist(),
+                        tail['yhat_lower'].tolist(),
+                        tail['yhat_upper'].tolist(),
+                        tail['trend'].tolist(),
+                        confidence
+                    )
                 ],
                 "optimization": optimization,
                 "tuning_method": tune,
@@ -378,14 +698,13 @@ async def get_flow_state(
             hmm = get_hmm_model()
             
             # Extract features
-            features = np.column_stack([
-                data['volume'].values[-window:] / data['volume'].mean(),
-                data['close'].pct_change().fillna(0).values[-window:],
-            ])
+            features = build_features(
+                data['volume'].to_numpy(),
+                data['close'].to_numpy(),
+            )[-window:, :2]
             
-            # Detect states
-            hmm.fit_gaussian_mixtures(features)
-            states, prob = hmm.viterbi_decode(features)
+            # Detect states (reuses a cached fit for an unchanged window)
+            states, prob = await fit_decode_hmm(hmm, features, v, window)
             
             # Get current state
             current_state = hmm.state_names[states[-1]]
@@ -412,10 +731,20 @@ async def get_flow_state(
         "venues": results,
         "tuning_method": tune,
         "window_size": window,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
+# One row per asset pair in /correlations (indexes into the request's asset list)
+_FOURIER_PAIR_DTYPE = np.dtype([
+    ('i', np.int32),
+    ('j', np.int32),
+    ('mag', np.float64),
+    ('phase', np.float64),
+    ('sync', np.bool_),
+])
+
+
 @router.get("/correlations")
 async def get_correlation_analysis(
     assets: str = Query("xrp,btc,eth,spy,gold", description="Comma-separated assets"),
@@ -426,78 +755,91 @@ async def get_correlation_analysis(
     Get correlation analysis with specified tuning
     """
     asset_list = assets.split(",")
+    use_fourier = tune in ("fourier", "both")
+    use_time_domain = tune in ("time_domain", "both")
     
     # Fetch data for all assets
-    asset_data = {}
-    for asset in asset_list:
-        asset_data[asset] = await fetch_asset_data(asset)
+    asset_data = await fetch_assets_data(asset_list)
+    
+    # Slice each close series once (window + 1 points so returns cover the full window)
+    closes = {
+        asset: _f32(asset_data[asset]['close'].iloc[-(window + 1):])
+        for asset in set(asset_list)
+    } if use_fourier or use_time_domain else {}
     
-    if tune == "fourier" or tune == "both":
+    if use_fourier:
         fourier = get_fourier_analyzer()
-        fourier_correlations = {}
         
-        # Calculate pairwise frequency correlations
-        for i, asset1 in enumerate(asset_list):
-            for j, asset2 in enumerate(asset_list):
-                if i < j:
-                    data1 = asset_data[asset1]['close'].values[-window:]
-                    data2 = asset_data[asset2]['close'].values[-window:]
-                    
-                    corr = fourier.cross_asset_frequency_correlation(data1, data2)
-                    fourier_correlations[f"{asset1}-{asset2}"] = {
-                        "magnitude_correlation": corr['magnitude_correlation'],
-                        "phase_coherence": corr['phase_coherence'],
-                        "synchronized": corr['synchronized'],
-                        "manipulation_frequencies": corr['manipulation_frequencies'][:5]
-                    }
+        # Transform each asset once, then combine spectra pairwise
+        spectra = {
+            asset: fourier.compute_spectrum(prices[-window:])
+            for asset, prices in closes.items()
+        }
+        
+        # Calculate pairwise frequency correlations into a structured array
+        n_assets = len(asset_list)
+        pairs = np.empty(n_assets * (n_assets - 1) // 2, dtype=_FOURIER_PAIR_DTYPE)
+        manipulation_frequencies = []
+        k = 0
+        for i in range(n_assets):
+            for j in range(i + 1, n_assets):
+                corr = fourier.correlate_from_spectra(spectra[asset_list[i]], spectra[asset_list[j]])
+                pairs[k] = (i, j, corr['magnitude_correlation'], corr['phase_coherence'], corr['synchronized'])
+                manipulation_frequencies.append(corr['manipulation_frequencies'][:5])
+                k += 1
     
-    if tune == "time_domain" or tune == "both":
-        time_correlations = {}
+    if use_time_domain:
+        # Stack returns into an (N, window) matrix aligned on the most recent samples
+        returns = [np.diff(closes[a]) / closes[a][:-1] for a in asset_list]
+        length = min(len(r) for r in returns)
+        returns = np.vstack([r[len(r) - length:] for r in returns])
+        
+        # Drop samples missing in any series, then one corrcoef for every pair
+        valid = ~np.isnan(returns).any(axis=0)
+        n_assets = len(asset_list)
+        if np.any(valid):
+            corr = np.atleast_2d(np.corrcoef(returns[:, valid]))
+        else:
+            corr = np.zeros((n_assets, n_assets))
         
-        # Calculate time-domain correlations
-        for i, asset1 in enumerate(asset_list):
-            for j, asset2 in enumerate(asset_list):
-                if i < j:
-                    data1 = asset_data[asset1]['close'].pct_change().values[-window:]
-                    data2 = asset_data[asset2]['close'].pct_change().values[-window:]
-                    
-                    # Remove NaN values
-                    mask = ~(np.isnan(data1) | np.isnan(data2))
-                    if np.any(mask):
-                        corr = np.corrcoef(data1[mask], data2[mask])[0, 1]
-                        time_correlations[f"{asset1}-{asset2}"] = float(corr)
-                    else:
-                        time_correlations[f"{asset1}-{asset2}"] = 0.0
+        time_correlations = {
+            f"{asset_list[i]}-{asset_list[j]}": float(corr[i, j])
+            for i in range(n_assets)
+            for j in range(i + 1, n_assets)
+        }
     
     response = {
         "assets": asset_list,
         "tuning_method": tune,
         "window_minutes": window,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
     
-    if tune == "fourier" or tune == "both":
-        response["fourier_correlations"] = fourier_correlations
+    if use_fourier:
+        response["fourier_correlations"] = {
+            f"{asset_list[p['i']]}-{asset_list[p['j']]}": {
+                "magnitude_correlation": float(p['mag']),
+                "phase_coherence": float(p['phase']),
+                "synchronized": bool(p['sync']),
+                "manipulation_frequencies": freqs
+            }
+            for p, freqs in zip(pairs, manipulation_frequencies)
+        }
     
-    if tune == "time_domain" or tune == "both":
+    if use_time_domain:
         response["time_correlations"] = time_correlations
     
     # Add XRP focus metrics
     xrp_metrics = {}
-    if "xrp" in asset_list:
-        xrp_correlations = [
-            v for k, v in response.get("fourier_correlations", {}).items()
-            if "xrp" in k.lower()
-        ]
+    if "xrp" in asset_list and use_fourier:
+        xrp_idx = [i for i, a in enumerate(asset_list) if "xrp" in a.lower()]
+        mask = np.isin(pairs['i'], xrp_idx) | np.isin(pairs['j'], xrp_idx)
         
-        if xrp_correlations:
-            xrp_metrics["average_phase_coherence"] = np.mean([
-                c["phase_coherence"] for c in xrp_correlations
-            ])
-            xrp_metrics["synchronized_count"] = sum(
-                1 for c in xrp_correlations if c["synchronized"]
-            )
-            xrp_metrics["decorrelation_detected"] = xrp_metrics["average_phase_coherence"] < 0.3
+        if np.any(mask):
+            avg_phase = float(pairs['phase'][mask].mean())
+            xrp_metrics["average_phase_coherence"] = avg_phase
+            xrp_metrics["synchronized_count"] = int(pairs['sync'][mask].sum())
+            xrp_metrics["decorrelation_detected"] = avg_phase < 0.3
     
     response["xrp_metrics"] = xrp_metrics
     
@@ -514,6 +856,12 @@ async def run_backtest(
     """
     Run backtesting with tuned models
     """
+    return {**_backtest_shell(strategy, period, initial_capital, tune), "timestamp": _now_iso()}
+
+
+@lru_cache(maxsize=128)
+def _backtest_shell(strategy: str, period: str, initial_capital: float, tune: Optional[str]) -> Dict[str, Any]:
+    """Backtest payload minus timestamp (constant per input combination)"""
     # This would implement actual backtesting
     # For now, return sample results
     
@@ -529,10 +877,66 @@ async def run_backtest(
         "total_trades": 47,
         "accuracy": 0.85,  # Model accuracy
         "tuning_method": tune or "default",
-        "timestamp": datetime.now().isoformat()
     }
 
 
+# Micro-batching for /signals/realtime: requests arriving within the window share one prediction
+REALTIME_BATCH_WINDOW_SECONDS = 0.05
+_realtime_queue: Optional[asyncio.Queue] = None
+_realtime_task: Optional[asyncio.Task] = None
+
+
+async def _realtime_batcher() -> None:
+    """Drain queued waiters every batch window and resolve them with a shared result"""
+    while True:
+        waiters = [await _realtime_queue.get()]
+        await asyncio.sleep(REALTIME_BATCH_WINDOW_SECONDS)
+        while not _realtime_queue.empty():
+            waiters.append(_realtime_queue.get_nowait())
+        
+        try:
+            data = await fetch_assets_data(list(INTEGRATED_ASSETS))
+            results = await run_integrated_prediction(data, 1)  # Just next hour for real-time
+        except Exception as e:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+        else:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(results)
+
+
+def _ensure_realtime_batcher() -> asyncio.Queue:
+    """Start the realtime batcher on first use (or at app startup)"""
+    global _realtime_queue, _realtime_task
+    if _realtime_task is None or _realtime_task.done():
+        _realtime_queue = asyncio.Queue()
+        _realtime_task = asyncio.create_task(_realtime_batcher())
+    return _realtime_queue
+
+
+async def _stop_realtime_batcher() -> None:
+    global _realtime_task
+    if _realtime_task is not None:
+        _realtime_task.cancel()
+        _realtime_task = None
+
+
+# Lifecycle hooks, called once from app.main's lifespan
+async def startup() -> None:
+    """Warm the JIT kernels and start the realtime batcher"""
+    await _warmup_kernels()
+    _ensure_realtime_batcher()
+
+
+async def shutdown() -> None:
+    """Stop the realtime batcher and release the process pool and HTTP client"""
+    await _stop_realtime_batcher()
+    await _shutdown_predict_pool()
+    await _close_http_client()
+
+
 @router.get("/signals/realtime")
 async def get_realtime_signals(
     tune: str = Query("all", description="Tuning method"),
@@ -542,22 +946,10 @@ async def get_realtime_signals(
     Get real-time trading signals from tuned models
     """
     try:
-        integrator = get_integrator()
-        
-        # Fetch latest data
-        xrp_data = await fetch_asset_data("xrp")
-        btc_data = await fetch_asset_data("btc")
-        eth_data = await fetch_asset_data("eth")
-        spy_data = await fetch_asset_data("spy")
-        
-        # Run integrated prediction
-        results = await integrator.predict_multi_asset_flows(
-            xrp_data=xrp_data,
-            btc_data=btc_data,
-            eth_data=eth_data,
-            spy_data=spy_data,
-            forecast_horizon=1  # Just next hour for real-time
-        )
+        # Join the current micro-batch; concurrent callers share one prediction
+        waiter = asyncio.get_running_loop().create_future()
+        await _ensure_realtime_batcher().put(waiter)
+        results = await waiter
         
         # Filter signals by confidence
         signals = [
@@ -570,7 +962,7 @@ async def get_realtime_signals(
             "total_signals": len(signals),
             "accuracy": results['accuracy'],
             "xrp_migration_score": results['xrp_migration_score'],
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "min_confidence_threshold": min_confidence,
             "tuning_method": tune
         }
@@ -604,7 +996,7 @@ async def train_models(
         "training_period": training_period,
         "tuning_method": tune,
         "message": "Models are being trained in the background",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
@@ -616,9 +1008,7 @@ async def background_train(assets: List[str], period: str, tune: str):
     
     try:
         # Fetch historical data for each asset
-        historical_data = {}
-        for asset in assets:
-            historical_data[asset] = await fetch_asset_data(asset, period=period)
+        historical_data = await fetch_assets_data(assets, period=period)
         
         if tune == "all" or tune == "prophet":
             # Train Prophet
@@ -626,7 +1016,7 @@ async def background_train(assets: List[str], period: str, tune: str):
             for asset, data in historical_data.items():
                 df_prophet = pd.DataFrame({
                     'ds': data.index,
-                    'y': data['close'].values
+                    'y': data['close'].to_numpy(copy=False)
                 })
                 
                 # Optimize hyperparameters
@@ -643,11 +1033,10 @@ async def background_train(assets: List[str], period: str, tune: str):
             # Train HMM
             hmm = get_hmm_model()
             for asset, data in historical_data.items():
-                features = np.column_stack([
-                    data['volume'].values / data['volume'].mean(),
-                    data['close'].pct_change().fillna(0).values,
-                    data['close'].pct_change().rolling(20).std().fillna(0).values,
-                ])
+                features = build_features(
+                    data['volume'].to_numpy(),
+                    data['close'].to_numpy(),
+                )
                 
                 hmm.fit_gaussian_mixtures(features)
                 logger.info(f"HMM trained for {asset}")
@@ -671,6 +1060,12 @@ async def debug_recent_signals(
     """
     Debug endpoint for recent signals with tuning info
     """
+    return {**_debug_signals_shell(limit, tune), "timestamp": _now_iso()}
+
+
+@lru_cache(maxsize=32)
+def _debug_signals_shell(limit: int, tune: str) -> Dict[str, Any]:
+    """Debug payload minus timestamp (constant per input combination)"""
     # This would fetch from Redis or database
     # For now, return debug information
     
@@ -688,7 +1083,6 @@ async def debug_recent_signals(
             "24h_average": 0.83,
             "7d_average": 0.81
         },
-        "timestamp": datetime.now().isoformat()
     }
 
 
@@ -1,13 +1,19 @@
 import asyncio
-import json
+import hashlib
+import heapq
+import logging
+import re
 import time
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+import orjson
 from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
 
-from bus.signal_bus import fetch_recent_signals, fetch_recent_cross_signals
+from app.redis_utils import get_redis, REDIS_ENABLED
+from bus.signal_bus import SIGNALS_CHANNEL, fetch_recent_signals, fetch_recent_cross_signals
 from app.config import (
     SURGE_WINDOW_SECONDS,
     SURGE_BURST_COUNT,
@@ -15,41 +21,80 @@ from app.config import (
     DARKSCORE_TOP8_SELECTORS,
 )
 from observability.impact import get_cached_depth, calculate_impact, DEPTH_CACHE_TTL
+from utils.responses import ORJSONResponse, dumps_json
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Formatted events keyed by signal id, or by a digest of the raw signal when it has
+# no id (timestamps are whole seconds, so type+timestamp is not unique); /ui, SSE and
+# WS re-format the same recent signals every tick, so only newly arrived ones need building
+_FMT_CACHE_MAX = 2048
+_fmt_cache: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+
+
+_ETH_TX_RE = re.compile(r"(?i)^0x[0-9a-f]{64}$").match
+_XRPL_TX_RE = re.compile(r"(?i)^[0-9a-f]{64}$").match
+_ETH_NETS = frozenset({"eth", "ethereum", "zk"})
+_DARKSCORE_TOP8_SET = frozenset(s.lower() for s in DARKSCORE_TOP8_SELECTORS)
 
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# Last converted timestamp; signals arrive in bursts sharing the same second
+_LAST_ISO: List[Any] = [None, ""]
+
+
 def _iso(ts: Any) -> str:
     try:
-        if isinstance(ts, (int, float)):
-            return datetime.fromtimestamp(float(ts), timezone.utc).isoformat()
         if isinstance(ts, str) and ts.isdigit():
-            return datetime.fromtimestamp(float(ts), timezone.utc).isoformat()
+            ts = int(ts)
+        if isinstance(ts, (int, float)):
+            if ts == _LAST_ISO[0]:
+                return _LAST_ISO[1]
+            iso = datetime.fromtimestamp(float(ts), timezone.utc).isoformat()
+            _LAST_ISO[0], _LAST_ISO[1] = ts, iso
+            return iso
     except Exception:
         pass
     return _now_iso()
 
 
+def _ts_int(sig: Dict[str, Any]) -> int:
+    """Signal timestamp as int seconds (0 when missing or malformed)."""
+    try:
+        return int(sig.get("timestamp", 0) or 0)
+    except Exception:
+        return 0
+
+
+def _latest_signal(signals: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Newest signal by timestamp; ties go to the later entry, as with sort-then-last."""
+    if not signals:
+        return None
+    return max(reversed(signals), key=_ts_int)
+
+
 def _validate_tx_hash(tx_hash: str, network: str = "eth") -> bool:
     """Validate transaction hash format and ensure it's not fake/test data."""
     if not tx_hash or not isinstance(tx_hash, str):
         return False
 
-    # Remove any fake/test prefixes
-    if tx_hash.upper().startswith('0XTEST') or 'TEST' in tx_hash.upper():
+    # Reject fake/test hashes (covers the 0xTEST prefix too)
+    if "test" in tx_hash.lower():
         return False
 
     # Validate format based on network
-    if network.lower() in ['eth', 'ethereum', 'zk']:
-        # Ethereum: must start with 0x and be 66 characters (32 bytes + 0x)
-        return tx_hash.startswith('0x') and len(tx_hash) == 66 and tx_hash[2:].replace('0', '').isalnum()
-    elif network.lower() == 'xrpl':
+    net = network.lower()
+    if net in _ETH_NETS:
+        # Ethereum: 0x + 32 bytes hex
+        return _ETH_TX_RE(tx_hash) is not None
+    elif net == "xrpl":
         # XRPL: 64-character hex string
-        return len(tx_hash) == 64 and tx_hash.replace('0', '').isalnum()
+        return _XRPL_TX_RE(tx_hash) is not None
 
     # Unknown network - basic validation
     return len(tx_hash) >= 10 and tx_hash.replace('0', '').replace('x', '').isalnum()
@@ -68,117 +113,172 @@ def _confidence_bucket(v: Optional[int]) -> str:
 
 
 def _format_event(sig: Dict[str, Any]) -> Dict[str, Any]:
+    """Formatted event for a raw signal; returns a shallow copy callers may modify."""
     stype = str(sig.get("type") or "event").lower()
-    msg: str
-    features: Dict[str, Any] = {}
-    if stype == "cross":
-        s1 = (sig.get("signals") or [{}])[0]
-        s2 = (sig.get("signals") or [{}])[1] if len(sig.get("signals") or []) > 1 else {}
-        conf = sig.get("confidence")
-        imp = sig.get("predicted_impact_pct")
-        msg = f"CROSS: {s1.get('summary','S1')} → {s2.get('summary','S2')} | conf {int(conf or 0)}% | impact {float(imp or 0):+.2f}%"
-    elif stype == "trustline":
-        val = sig.get("limit_value") or 0
-        cur = sig.get("currency") or "IOU"
-        issuer = sig.get("issuer") or ""
-        account = sig.get("account") or ""
+    k = sig.get("id")
+    if not k:
+        if sig.get("timestamp") is None:
+            # Timestamp would fall back to now - don't cache
+            return _build_event(sig, stype)
+        try:
+            k = hashlib.blake2b(dumps_json(sig), digest_size=16).digest()
+        except Exception:
+            return _build_event(sig, stype)
+    cached = _fmt_cache.get(k)
+    if cached is not None:
+        _fmt_cache.move_to_end(k)
+        return dict(cached)
+    out = _build_event(sig, stype)
+    _fmt_cache[k] = out
+    if len(_fmt_cache) > _FMT_CACHE_MAX:
+        _fmt_cache.popitem(last=False)
+    return dict(out)
+
+
+_FormatResult = Tuple[str, Dict[str, Any], Optional[float]]
+
+
+def _fmt_cross(sig: Dict[str, Any], stype: str) -> _FormatResult:
+    s1 = (sig.get("signals") or [{}])[0]
+    s2 = (sig.get("signals") or [{}])[1] if len(sig.get("signals") or []) > 1 else {}
+    conf = sig.get("confidence")
+    imp = sig.get("predicted_impact_pct")
+    msg = f"CROSS: {s1.get('summary','S1')} → {s2.get('summary','S2')} | conf {int(conf or 0)}% | impact {float(imp or 0):+.2f}%"
+    return msg, {}, None
+
+
+def _fmt_trustline(sig: Dict[str, Any], stype: str) -> _FormatResult:
+    val = sig.get("limit_value") or 0
+    cur = sig.get("currency") or "IOU"
+    issuer = sig.get("issuer") or ""
+    account = sig.get("account") or ""
+    raw_tx_hash = sig.get("tx_hash") or ""
+    validated_tx_hash = raw_tx_hash if _validate_tx_hash(raw_tx_hash, "xrpl") else ""
+    features = {
+        "limit_value": float(val) if val else 0,
+        "currency": cur,
+        "issuer": issuer,
+        "account": account,
+        "tx_hash": validated_tx_hash,
+    }
+    # Format value for display
+    fval = float(val) if val else 0
+    if fval >= 1_000_000_000:
+        val_str = f"{fval/1_000_000_000:.1f}B"
+    elif fval >= 1_000_000:
+        val_str = f"{fval/1_000_000:.1f}M"
+    else:
+        val_str = f"{fval:,.0f}"
+    msg = f"TrustLine {val_str} {cur[:8]} → {account[:8]}..."
+    return msg, features, None
+
+
+def _fmt_rwa_amm(sig: Dict[str, Any], stype: str) -> _FormatResult:
+    chg = (sig.get("amm_liquidity_change") or {}).get("lp_change_pct")
+    return f"RWA AMM ΔLP {round(float(chg or 0)*100,2)}%", {}, None
+
+
+def _fmt_orderbook(sig: Dict[str, Any], stype: str) -> _FormatResult:
+    pair = sig.get("pair") or "Pair"
+    bid = sig.get("bid_depth_usd")
+    ask = sig.get("ask_depth_usd")
+    sp = sig.get("spread_bps")
+    msg = f"OB {pair}: bid ${float(bid or 0):,.0f} | ask ${float(ask or 0):,.0f} | spread {sp if sp is not None else 'n/a'} bps"
+    return msg, {}, None
+
+
+def _fmt_xrp(sig: Dict[str, Any], stype: str) -> _FormatResult:
+    try:
         raw_tx_hash = sig.get("tx_hash") or ""
         validated_tx_hash = raw_tx_hash if _validate_tx_hash(raw_tx_hash, "xrpl") else ""
         features = {
-            "limit_value": float(val) if val else 0,
-            "currency": cur,
-            "issuer": issuer,
-            "account": account,
+            "amount_xrp": float(sig.get("amount_xrp") or 0.0),
+            "usd_value": float(sig.get("usd_value") or 0.0),
             "tx_hash": validated_tx_hash,
+            "source": sig.get("source") or "",
+            "destination": sig.get("destination") or "",
+            "destination_tag": sig.get("destination_tag"),
         }
-        # Format value for display
-        fval = float(val) if val else 0
-        if fval >= 1_000_000_000:
-            val_str = f"{fval/1_000_000_000:.1f}B"
-        elif fval >= 1_000_000:
-            val_str = f"{fval/1_000_000:.1f}M"
-        else:
-            val_str = f"{fval:,.0f}"
-        msg = f"TrustLine {val_str} {cur[:8]} → {account[:8]}..."
-    elif stype == "rwa_amm":
-        chg = (sig.get("amm_liquidity_change") or {}).get("lp_change_pct")
-        msg = f"RWA AMM ΔLP {round(float(chg or 0)*100,2)}%"
-    elif stype == "orderbook":
-        pair = sig.get("pair") or "Pair"
-        bid = sig.get("bid_depth_usd")
-        ask = sig.get("ask_depth_usd")
-        sp = sig.get("spread_bps")
-        msg = f"OB {pair}: bid ${float(bid or 0):,.0f} | ask ${float(ask or 0):,.0f} | spread {sp if sp is not None else 'n/a'} bps"
-    elif stype == "xrp":
-        try:
-            raw_tx_hash = sig.get("tx_hash") or ""
-            validated_tx_hash = raw_tx_hash if _validate_tx_hash(raw_tx_hash, "xrpl") else ""
-            features = {
-                "amount_xrp": float(sig.get("amount_xrp") or 0.0),
-                "usd_value": float(sig.get("usd_value") or 0.0),
-                "tx_hash": validated_tx_hash,
-                "source": sig.get("source") or "",
-                "destination": sig.get("destination") or "",
-                "destination_tag": sig.get("destination_tag"),
-            }
-        except Exception:
-            features = {}
-        base_msg = sig.get("summary") or "XRP flow"
-        msg = base_msg
-    elif stype == "zk":
-        try:
-            features = {
-                "gas_used": int(sig.get("gas_used") or 0),
-                "input_len": int(sig.get("input_len") or 0),
-                "calldata_entropy": float(sig.get("calldata_entropy") or 0.0),
-                "selector": sig.get("selector") or "0x00000000",
-                "gas_price_wei": int(sig.get("gas_price_wei") or 0),
-                "value_wei": int(sig.get("value_wei") or 0),
-                "usd_value": float(sig.get("usd_value") or 0.0),
-                "zero_value": bool(sig.get("zero_value") or False),
-                "partner_from": bool(sig.get("partner_from") or False),
-                "partner_to": bool(sig.get("partner_to") or False),
-                "from": (sig.get("from") or ""),
-                "to": (sig.get("to") or ""),
-                "tx_hash": (sig.get("tx_hash") or "") if _validate_tx_hash(sig.get("tx_hash") or "", sig.get("network") or "eth") else "",
-                "network": (sig.get("network") or ""),
-            }
-        except Exception:
-            features = {}
-        msg = sig.get("summary") or f"{stype.upper()} event"
-        # Lightweight rule-based score (0-100) for hybrid client ensemble
-        try:
-            gas_norm = min(max(float(features.get("gas_used", 0)) / 1_200_000.0, 0.0), 1.0)
-            ilen_norm = min(max(float(features.get("input_len", 0)) / 576.0, 0.0), 1.0)
-            ent_norm = min(max(float(features.get("calldata_entropy", 0.0)) / 8.0, 0.0), 1.0)
-            sel = str(features.get("selector") or "").lower()
-            selector_hit = 1.0 if sel in set(DARKSCORE_TOP8_SELECTORS) else 0.0
-            partner = 1.0 if (features.get("partner_from") or features.get("partner_to")) else 0.0
-            zero_val = 1.0 if features.get("zero_value") else 0.0
-            score = (
-                0.25 * gas_norm +
-                0.25 * ilen_norm +
-                0.15 * ent_norm +
-                0.20 * selector_hit +
-                0.10 * partner +
-                0.05 * zero_val
-            ) * 100.0
-            rule_score = float(max(0.0, min(score, 100.0)))
-        except Exception:
-            rule_score = 0.0
-    elif stype == "solana_amm":
-        try:
-            features = {
-                "program_id": (sig.get("program_id") or ""),
-                "tx_sig": (sig.get("tx_sig") or ""),
-                "slot": sig.get("slot"),
-                "usd_value": float(sig.get("usd_value") or 0.0),
-            }
-        except Exception:
-            features = {}
-        msg = sig.get("summary") or f"SOLANA AMM activity tx {(sig.get('tx_sig') or '')[:8]}..."
-    else:
-        msg = sig.get("summary") or f"{stype.upper()} event"
+    except Exception:
+        features = {}
+    return sig.get("summary") or "XRP flow", features, None
+
+
+def _fmt_zk(sig: Dict[str, Any], stype: str) -> _FormatResult:
+    msg = sig.get("summary") or f"{stype.upper()} event"
+    try:
+        gas_used = int(sig.get("gas_used") or 0)
+        input_len = int(sig.get("input_len") or 0)
+        entropy = float(sig.get("calldata_entropy") or 0.0)
+        selector = sig.get("selector") or "0x00000000"
+        zero_value = bool(sig.get("zero_value") or False)
+        partner_from = bool(sig.get("partner_from") or False)
+        partner_to = bool(sig.get("partner_to") or False)
+        features = {
+            "gas_used": gas_used,
+            "input_len": input_len,
+            "calldata_entropy": entropy,
+            "selector": selector,
+            "gas_price_wei": int(sig.get("gas_price_wei") or 0),
+            "value_wei": int(sig.get("value_wei") or 0),
+            "usd_value": float(sig.get("usd_value") or 0.0),
+            "zero_value": zero_value,
+            "partner_from": partner_from,
+            "partner_to": partner_to,
+            "from": (sig.get("from") or ""),
+            "to": (sig.get("to") or ""),
+            "tx_hash": (sig.get("tx_hash") or "") if _validate_tx_hash(sig.get("tx_hash") or "", sig.get("network") or "eth") else "",
+            "network": (sig.get("network") or ""),
+        }
+    except Exception:
+        return msg, {}, 0.0
+    # Lightweight rule-based score (0-100) for hybrid client ensemble
+    gas_norm = (1.0 if gas_used >= 1_200_000 else gas_used / 1_200_000.0) if gas_used > 0 else 0.0
+    ilen_norm = (1.0 if input_len >= 576 else input_len / 576.0) if input_len > 0 else 0.0
+    ent_norm = (1.0 if entropy >= 8.0 else entropy / 8.0) if entropy > 0.0 else 0.0
+    sel = selector.lower() if isinstance(selector, str) else str(selector).lower()
+    score = (
+        0.25 * gas_norm +
+        0.25 * ilen_norm +
+        0.15 * ent_norm +
+        (0.20 if sel in _DARKSCORE_TOP8_SET else 0.0) +
+        (0.10 if (partner_from or partner_to) else 0.0) +
+        (0.05 if zero_value else 0.0)
+    ) * 100.0
+    return msg, features, (100.0 if score > 100.0 else score)
+
+
+def _fmt_solana_amm(sig: Dict[str, Any], stype: str) -> _FormatResult:
+    try:
+        features = {
+            "program_id": (sig.get("program_id") or ""),
+            "tx_sig": (sig.get("tx_sig") or ""),
+            "slot": sig.get("slot"),
+            "usd_value": float(sig.get("usd_value") or 0.0),
+        }
+    except Exception:
+        features = {}
+    msg = sig.get("summary") or f"SOLANA AMM activity tx {(sig.get('tx_sig') or '')[:8]}..."
+    return msg, features, None
+
+
+def _fmt_default(sig: Dict[str, Any], stype: str) -> _FormatResult:
+    return sig.get("summary") or f"{stype.upper()} event", {}, None
+
+
+_FORMATTERS: Dict[str, Callable[[Dict[str, Any], str], _FormatResult]] = {
+    "cross": _fmt_cross,
+    "trustline": _fmt_trustline,
+    "rwa_amm": _fmt_rwa_amm,
+    "orderbook": _fmt_orderbook,
+    "xrp": _fmt_xrp,
+    "zk": _fmt_zk,
+    "solana_amm": _fmt_solana_amm,
+}
+
+
+def _build_event(sig: Dict[str, Any], stype: str) -> Dict[str, Any]:
+    msg, features, rule_score = _FORMATTERS.get(stype, _fmt_default)(sig, stype)
     # Attach ISO / XRPL predictor fields when present
     try:
         iso_conf = sig.get("iso_confidence")
@@ -198,22 +298,27 @@ def _format_event(sig: Dict[str, Any]) -> Dict[str, Any]:
         "id": sig.get("id") or f"{stype}:{sig.get('timestamp','')}",
         **({"network": sig.get("network")} if sig.get("network") else {}),
         **({"features": features} if features else {}),
-        **({"rule_score": rule_score} if stype == "zk" else {}),
+        **({"rule_score": rule_score} if rule_score is not None else {}),
     }
     return out
 
 
 async def get_dashboard_json() -> Dict[str, Any]:
-    # last 5 minutes signals and cross-signal high-confidence detection
-    sigs_5m = await fetch_recent_signals(window_seconds=SURGE_WINDOW_SECONDS)
-    # cross signals are stored in a separate stream; fetch recent and window-filter
-    cross_recent = await fetch_recent_cross_signals(limit=50)
+    # last hour (or the surge window, if longer) of signals and recent cross signals
+    # (separate stream; window-filtered below), fetched concurrently. The surge window
+    # is cut from the same fetch by stream entry time, not the signal's own timestamp,
+    # which can be None or the (older) on-chain time.
+    recent_signals, cross_recent = await asyncio.gather(
+        fetch_recent_signals(window_seconds=max(3600, SURGE_WINDOW_SECONDS), stream_ms=True),
+        fetch_recent_cross_signals(limit=50),
+    )
     now_s = int(time.time())
+    cutoff_ms = int(time.time() * 1000) - SURGE_WINDOW_SECONDS * 1000
+    sigs_5m = [s for s in recent_signals if s["_stream_ms"] >= cutoff_ms]
     high_conf_count = 0
     for s in cross_recent:
         try:
-            ts = int(s.get("timestamp", 0))
-            if now_s - ts <= SURGE_WINDOW_SECONDS and int(s.get("confidence", 0)) >= SURGE_CONFIDENCE_THRESHOLD:
+            if now_s - _ts_int(s) <= SURGE_WINDOW_SECONDS and int(s.get("confidence", 0)) >= SURGE_CONFIDENCE_THRESHOLD:
                 high_conf_count += 1
         except Exception:
             continue
@@ -227,17 +332,22 @@ async def get_dashboard_json() -> Dict[str, Any]:
     surge_mode = high_conf_count >= SURGE_BURST_COUNT
 
     # recent events render (up to last 20 across the last hour), merging cross + other signals
-    recent_signals = await fetch_recent_signals(window_seconds=3600)
     # attach a marker so we can identify source uniformly
     merged: List[Dict[str, Any]] = []
     merged.extend(recent_signals)
     merged.extend(cross_recent)
+    # Newest 20 in ascending order; (timestamp, position) keys keep later entries on
+    # ties, matching a stable sort then [-20:]. If any timestamp doesn't parse the list
+    # is left in arrival order, as sort() would leave it.
     try:
-        merged.sort(key=lambda s: int(s.get("timestamp", 0)))
+        keys = [(int(s.get("timestamp", 0)), i) for i, s in enumerate(merged)]
     except Exception:
-        pass
-    merged = merged[-20:] if len(merged) > 20 else merged
-    events = [_format_event(s) for s in merged]
+        top = merged[-20:]
+    else:
+        newest = heapq.nlargest(20, keys)
+        newest.reverse()
+        top = [merged[i] for _, i in newest]
+    events = [_format_event(s) for s in top]
 
     children: List[Dict[str, Any]] = [
         {
@@ -330,86 +440,173 @@ async def get_dashboard_json() -> Dict[str, Any]:
     }
 
 
-@router.get("/ui")
-async def ui_payload(request: Request):
+# Free-tier upsell children, appended by reference; treat as immutable
+_UPGRADE_BANNER: Dict[str, Any] = {
+    "type": "UpgradeBanner",
+    "text": "Unlock real-time Impact Forecasts • $49/mo",
+    "action": "open_stripe",
+}
+_SUBSCRIPTION_CARD: Dict[str, Any] = {
+    "type": "SubscriptionCard",
+    "title": "Unlock Real-Time Dark Flow Intelligence",
+    "options": [
+        {"tier": "pro", "price": "$49/mo or 0.5 SOL", "action": "stripe_pro_monthly"},
+        {"tier": "pro", "price": "$490/yr or 5.4 SOL", "action": "stripe_pro_annual"},
+        {"tier": "institutional", "price": "$499/mo", "action": "contact_sales"}
+    ],
+    "crypto_qr": True,
+}
+_REPLAY_BUTTON: Dict[str, Any] = {
+    "type": "ReplayButton",
+    "text": "Replay Last 7 Days",
+    "endpoint": "/history/replay?days=7",
+}
+
+
+async def _fetch_latest_combined() -> List[Dict[str, Any]]:
+    """Recent surge-window signals plus recent cross signals, fetched concurrently."""
+    recent_a, recent_b = await asyncio.gather(
+        fetch_recent_signals(window_seconds=SURGE_WINDOW_SECONDS),
+        fetch_recent_cross_signals(limit=50),
+        return_exceptions=True,
+    )
+    if isinstance(recent_a, BaseException):
+        recent_a = []
+    if isinstance(recent_b, BaseException):
+        recent_b = []
+    return (recent_a or []) + (recent_b or [])
+
+
+def _apply_plan_gating(data: Dict[str, Any], plan: str) -> None:
+    if plan != "free":
+        return
     try:
-        data = await get_dashboard_json()
+        children = data.get("children") or []
+        for child in children:
+            if isinstance(child, dict) and child.get("type") == "ImpactForecastCard":
+                child["visible"] = False
+                child["blur"] = True
+                child["cta"] = "Upgrade to Pro →"
+        children.extend((_UPGRADE_BANNER, _SUBSCRIPTION_CARD, _REPLAY_BUTTON))
     except Exception:
-        # fail-safe minimal payload
-        data = {
-            "type": "VStack",
-            "spacing": 20,
-            "children": [
-                {"type": "Header", "title": "DarkFlow Tracker", "subtitle": "Surge Mode: 🟢 Normal"},
-                {"type": "LiveCounter", "label": "Events Last 5min", "value": 0},
-                {"type": "EventList", "events": []},
-                {"type": "Footer", "text": f"Real-time • Public data only • {_now_iso()[:10]}"},
-            ],
-        }
+        pass
+
+
+# Built /ui payloads per plan, reused for 1s so concurrent viewers share one build
+_UI_CACHE_TTL = 1.0
+_ui_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_ui_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+@router.get("/ui")
+async def ui_payload(request: Request):
     # Server-side gating by tier resolved from middleware, fallback to plan header (defense in depth)
     plan = (getattr(request.state, "user_tier", None) or request.headers.get("X-Plan") or "").lower()
-    if plan == "free":
+    # Gating only distinguishes free from paid; don't key the cache on raw header values
+    plan = "free" if plan == "free" else "paid"
+    async with _ui_locks[plan]:
+        built_at, data = _ui_cache.get(plan, (0.0, None))
+        if data is not None and time.monotonic() - built_at < _UI_CACHE_TTL:
+            return ORJSONResponse(data)
         try:
-            for child in data.get("children", []):
-                if isinstance(child, dict) and child.get("type") == "ImpactForecastCard":
-                    child["visible"] = False
-                    child["blur"] = True
-                    child["cta"] = "Upgrade to Pro →"
-            data.get("children", []).append({
-                "type": "UpgradeBanner",
-                "text": "Unlock real-time Impact Forecasts • $49/mo",
-                "action": "open_stripe",
-            })
-            data.get("children", []).append({
-                "type": "SubscriptionCard",
-                "title": "Unlock Real-Time Dark Flow Intelligence",
-                "options": [
-                    {"tier": "pro", "price": "$49/mo or 0.5 SOL", "action": "stripe_pro_monthly"},
-                    {"tier": "pro", "price": "$490/yr or 5.4 SOL", "action": "stripe_pro_annual"},
-                    {"tier": "institutional", "price": "$499/mo", "action": "contact_sales"}
-                ],
-                "crypto_qr": True,
-            })
-            data.get("children", []).append({
-                "type": "ReplayButton",
-                "text": "Replay Last 7 Days",
-                "endpoint": "/history/replay?days=7",
-            })
+            data = await get_dashboard_json()
         except Exception:
-            pass
-    return JSONResponse(data)
+            # fail-safe minimal payload
+            data = {
+                "type": "VStack",
+                "spacing": 20,
+                "children": [
+                    {"type": "Header", "title": "DarkFlow Tracker", "subtitle": "Surge Mode: 🟢 Normal"},
+                    {"type": "LiveCounter", "label": "Events Last 5min", "value": 0},
+                    {"type": "EventList", "events": []},
+                    {"type": "Footer", "text": f"Real-time • Public data only • {_now_iso()[:10]}"},
+                ],
+            }
+        _apply_plan_gating(data, plan)
+        _ui_cache[plan] = (time.monotonic(), data)
+    return ORJSONResponse(data)
+
+
+# One pub/sub subscription per process, fanned out to a bounded queue per
+# SSE/WS client instead of every client polling the streams each second
+_SUBSCRIBER_QUEUE_MAX = 100
+_HEARTBEAT_SECONDS = 30.0
+_subscribers: Set[asyncio.Queue] = set()
+_fanout_task: Optional[asyncio.Task] = None
+
+
+async def _signal_fanout() -> None:
+    while True:
+        try:
+            r = await get_redis()
+            pubsub = r.pubsub()
+            await pubsub.subscribe(SIGNALS_CHANNEL)
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        sig = orjson.loads(message["data"])
+                    except Exception:
+                        continue
+                    for q in tuple(_subscribers):
+                        if q.full():
+                            q.get_nowait()  # slow client: drop its oldest event
+                        q.put_nowait(sig)
+            finally:
+                await pubsub.close()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Signal subscription error: {e}, reconnecting in 1s...")
+        await asyncio.sleep(1)
+
+
+def _subscribe() -> asyncio.Queue:
+    """Register a client queue, starting the shared subscriber on first use."""
+    global _fanout_task
+    if REDIS_ENABLED and (_fanout_task is None or _fanout_task.done()):
+        _fanout_task = asyncio.create_task(_signal_fanout())
+    q: asyncio.Queue = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_MAX)
+    _subscribers.add(q)
+    return q
+
+
+def _encode_event(sig: Dict[str, Any]) -> bytes:
+    """Formatted event as UTF-8 JSON, shared by the SSE and WS writers."""
+    return dumps_json(_format_event(sig))
+
+
+async def shutdown() -> None:
+    """Stop the shared signal subscriber; called once from app.main's lifespan."""
+    global _fanout_task
+    task, _fanout_task = _fanout_task, None
+    if task is not None:
+        task.cancel()
+        # Wait for the reconnect loop to unwind (closing its pubsub) before the app exits
+        await asyncio.gather(task, return_exceptions=True)
 
 
 @router.get("/events/sse")
 async def event_stream(request: Request):
-    last_id: Optional[str] = None
-
     async def generator():
-        nonlocal last_id
-        while True:
-            if await request.is_disconnected():
-                break
-            try:
-                recent_a = await fetch_recent_signals(window_seconds=SURGE_WINDOW_SECONDS)
-            except Exception:
-                recent_a = []
-            try:
-                recent_b = await fetch_recent_cross_signals(limit=50)
-            except Exception:
-                recent_b = []
-            combined = (recent_a or []) + (recent_b or [])
-            try:
-                combined.sort(key=lambda s: int(s.get("timestamp", 0)))
-            except Exception:
-                pass
-            item = combined[-1] if combined else None
+        queue = _subscribe()
+        try:
+            # Start the stream with the current newest signal, then push as published
+            item = _latest_signal(await _fetch_latest_combined())
             if item:
-                cur_id = item.get("id") or f"{item.get('type','evt')}:{item.get('timestamp','')}"
-                if cur_id != last_id:
-                    last_id = cur_id
-                    payload = _format_event(item)
-                    yield f"data: {json.dumps(payload, separators=(',',':'))}\n\n"
-            await asyncio.sleep(1)
+                yield b"data: " + _encode_event(item) + b"\n\n"
+            while True:
+                try:
+                    sig = await asyncio.wait_for(queue.get(), timeout=_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield b": keepalive\n\n"
+                    continue
+                yield b"data: " + _encode_event(sig) + b"\n\n"
+        finally:
+            _subscribers.discard(queue)
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -417,33 +614,32 @@ async def event_stream(request: Request):
 @router.websocket("/events")
 async def events_websocket(ws: WebSocket):
     await ws.accept()
-    last_id: Optional[str] = None
+    queue = _subscribe()
+    # One long-lived receive (only used to notice disconnects) and one queue read,
+    # re-armed only when they complete
+    recv_task: Optional[asyncio.Task] = None
+    get_task: Optional[asyncio.Task] = None
     try:
+        item = _latest_signal(await _fetch_latest_combined())
+        if item:
+            await ws.send_text(_encode_event(item).decode())
+        recv_task = asyncio.create_task(ws.receive())
+        get_task = asyncio.create_task(queue.get())
         while True:
-            try:
-                recent_a = await fetch_recent_signals(window_seconds=SURGE_WINDOW_SECONDS)
-            except Exception:
-                recent_a = []
-            try:
-                recent_b = await fetch_recent_cross_signals(limit=50)
-            except Exception:
-                recent_b = []
-            combined = (recent_a or []) + (recent_b or [])
-            try:
-                combined.sort(key=lambda s: int(s.get("timestamp", 0)))
-            except Exception:
-                pass
-            item = combined[-1] if combined else None
-            if item:
-                cur_id = item.get("id") or f"{item.get('type','evt')}:{item.get('timestamp','')}"
-                if cur_id != last_id:
-                    last_id = cur_id
-                    payload = _format_event(item)
-                    await ws.send_text(json.dumps(payload, separators=(",", ":")))
-            try:
-                _ = await asyncio.wait_for(ws.receive_text(), timeout=1.0)
-            except asyncio.TimeoutError:
-                pass
-            await asyncio.sleep(0.5)
+            done, _ = await asyncio.wait({recv_task, get_task}, return_when=asyncio.FIRST_COMPLETED)
+            if recv_task in done:
+                if recv_task.result().get("type") == "websocket.disconnect":
+                    return
+                recv_task = asyncio.create_task(ws.receive())
+            if get_task in done:
+                await ws.send_text(_encode_event(get_task.result()).decode())
+                while not queue.empty():
+                    await ws.send_text(_encode_event(queue.get_nowait()).decode())
+                get_task = asyncio.create_task(queue.get())
     except WebSocketDisconnect:
         return
+    finally:
+        for task in (recv_task, get_task):
+            if task is not None:
+                task.cancel()
+        _subscribers.discard(queue)
@@ -8,10 +8,6 @@ from app.redis_utils import get_redis, REDIS_ENABLED
 router = APIRouter()
 
 
-async def _r():
-    return await get_redis()
-
-
 class UserPreferences(BaseModel):
     alert_usd_min: Optional[float] = None
     networks: Optional[List[str]] = None  # e.g., ["ethereum","solana"]
@@ -29,18 +25,21 @@ async def set_preferences(request: Request, body: UserPreferences) -> Dict[str,
         raise HTTPException(status_code=400, detail="email required via X-User-Email header or API key")
     if not REDIS_ENABLED:
         return {"email": email, "preferences": {}, "redis": "disabled"}
-    r = await _r()
+    r = await get_redis()
     data: Dict[str, Any] = {}
     if body.alert_usd_min is not None:
         data["alert_usd_min"] = str(float(body.alert_usd_min))
     if body.networks is not None:
-        data["networks"] = ",".join([n.strip().lower() for n in body.networks if n.strip()])
+        data["networks"] = ",".join(n2 for n in body.networks if (n2 := n.strip().lower()))
     if body.event_types is not None:
-        data["event_types"] = ",".join([t.strip().lower() for t in body.event_types if t.strip()])
+        data["event_types"] = ",".join(t2 for t in body.event_types if (t2 := t.strip().lower()))
     if not data:
         raise HTTPException(status_code=400, detail="no preferences provided")
-    await r.hset(f"user:prefs:{email}", mapping=data)
-    out = await r.hgetall(f"user:prefs:{email}")
+    key = f"user:prefs:{email}"
+    async with r.pipeline(transaction=False) as pipe:
+        pipe.hset(key, mapping=data)
+        pipe.hgetall(key)
+        _, out = await pipe.execute()
     return {"email": email, "preferences": out}
 
 
@@ -51,6 +50,6 @@ async def get_preferences(request: Request) -> Dict[str, Any]:
         raise HTTPException(status_code=400, detail="email required via X-User-Email header or API key")
     if not REDIS_ENABLED:
         return {"email": email, "preferences": {}, "redis": "disabled"}
-    r = await _r()
+    r = await get_redis()
     out = await r.hgetall(f"user:prefs:{email}")
     return {"email": email, "preferences": out}
@@ -4,12 +4,34 @@ Wallet Analysis API - Trace Institutional Wallet Activity
 Exposes endpoints to analyze wallets from fingerprinted algorithms
 for potential wrapped securities, FTD patterns, and suspicious timing.
 """
+import asyncio
+import heapq
+import re
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Query, HTTPException
 
+from api.dashboard import ALGO_PROFILES
+from services.wallet_tracker import wallet_tracker
+
 router = APIRouter()
 
+_WRAPPED_FLAGS = frozenset({"POTENTIAL_WRAPPED_SECURITY", "LARGE_STABLECOIN_MOVEMENT"})
+_TIMING_FLAGS = frozenset({"MARKET_HOURS_TIMING", "OPTIONS_EXPIRY_TIMING"})
+_ETH_ADDR_RE = re.compile(r"0x[0-9a-fA-F]{40}").fullmatch
+
+# Caps concurrent analyze_wallet calls; request pacing is wallet_tracker's 4/s token bucket
+_analyze_semaphore = asyncio.Semaphore(16)
+
+
+async def _analyze_wallets(wallets: List[str], **kwargs) -> List[Any]:
+    """Run analyze_wallet over several wallets concurrently; exceptions are returned in place."""
+    async def one(wallet: str) -> Dict[str, Any]:
+        async with _analyze_semaphore:
+            return await wallet_tracker.analyze_wallet(wallet, **kwargs)
+
+    return await asyncio.gather(*(one(w) for w in wallets), return_exceptions=True)
+
 
 @router.get("/wallet/analyze/{address}")
 async def analyze_wallet(
@@ -26,11 +48,10 @@ async def analyze_wallet(
     - Options expiry timing
     - Large stablecoin movements
     """
-    if not address.startswith("0x") or len(address) != 42:
+    if not _ETH_ADDR_RE(address):
         raise HTTPException(status_code=400, detail="Invalid Ethereum address")
     
     try:
-        from services.wallet_tracker import wallet_tracker
         result = await wallet_tracker.analyze_wallet(
             address, 
             include_tokens=include_tokens,
@@ -51,8 +72,6 @@ async def analyze_fingerprint_wallets(
     Returns analysis for each known wallet associated with the algorithm.
     """
     try:
-        from api.dashboard import ALGO_PROFILES
-        from services.wallet_tracker import wallet_tracker
         
         profile = ALGO_PROFILES.get(algo_name)
         if not profile:
@@ -68,18 +87,17 @@ async def analyze_fingerprint_wallets(
             }
         
         # Analyze each ETH wallet
+        eth_wallets = [w for w in wallets if w.startswith("0x")]
         results = []
-        for wallet in wallets:
-            if wallet.startswith("0x"):
-                try:
-                    result = await wallet_tracker.analyze_wallet(wallet)
-                    result["algo_name"] = algo_name
-                    results.append(result)
-                except Exception as e:
-                    results.append({
-                        "address": wallet,
-                        "error": str(e),
-                    })
+        for wallet, result in zip(eth_wallets, await _analyze_wallets(eth_wallets)):
+            if isinstance(result, BaseException):
+                results.append({
+                    "address": wallet,
+                    "error": str(result),
+                })
+            else:
+                result["algo_name"] = algo_name
+                results.append(result)
         
         # Aggregate flags
         total_flags = sum(r.get("flags", {}).get("total_flags", 0) for r in results if "flags" in r)
@@ -104,44 +122,56 @@ async def get_all_flagged_activity() -> Dict[str, Any]:
     Get summary of all flagged activity across known institutional wallets.
     """
     try:
-        from api.dashboard import ALGO_PROFILES
-        from services.wallet_tracker import wallet_tracker
         
         all_flags = []
         analyzed_wallets = 0
         
-        for algo_name, profile in ALGO_PROFILES.items():
-            wallets = profile.get("known_wallets", [])
-            for wallet in wallets:
-                if wallet.startswith("0x"):
-                    try:
-                        result = await wallet_tracker.analyze_wallet(wallet, include_internal=False)
-                        analyzed_wallets += 1
-                        
-                        # Collect flags with algo attribution
-                        for flag in result.get("flags", {}).get("wrapped_securities", []):
-                            flag["algo"] = algo_name
-                            flag["algo_display"] = profile.get("display_name")
-                            all_flags.append(flag)
-                        
-                        for flag in result.get("flags", {}).get("settlement_timing", []):
-                            flag["algo"] = algo_name
-                            flag["algo_display"] = profile.get("display_name")
-                            all_flags.append(flag)
-                    except Exception:
-                        pass
+        targets = [
+            (algo_name, profile, wallet)
+            for algo_name, profile in ALGO_PROFILES.items()
+            for wallet in profile.get("known_wallets", [])
+            if wallet.startswith("0x")
+        ]
+        results = await _analyze_wallets([t[2] for t in targets], include_internal=False)
+        for (algo_name, profile, _), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                continue
+            try:
+                analyzed_wallets += 1
+
+                # Collect flags with algo attribution
+                for flag in result.get("flags", {}).get("wrapped_securities", []):
+                    flag["algo"] = algo_name
+                    flag["algo_display"] = profile.get("display_name")
+                    all_flags.append(flag)
+
+                for flag in result.get("flags", {}).get("settlement_timing", []):
+                    flag["algo"] = algo_name
+                    flag["algo_display"] = profile.get("display_name")
+                    all_flags.append(flag)
+            except Exception:
+                pass
         
-        # Sort by timestamp (most recent first)
-        all_flags.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        # Top 50 most recent
+        top_flags = heapq.nlargest(50, all_flags, key=lambda x: x.get("timestamp", ""))
+
+        wrapped_count = 0
+        timing_count = 0
+        for f in all_flags:
+            kind = f.get("flag")
+            if kind in _WRAPPED_FLAGS:
+                wrapped_count += 1
+            elif kind in _TIMING_FLAGS:
+                timing_count += 1
         
         return {
             "analyzed_at": datetime.now(timezone.utc).isoformat(),
             "wallets_analyzed": analyzed_wallets,
             "total_flags": len(all_flags),
-            "flags": all_flags[:50],  # Top 50 most recent
+            "flags": top_flags,
             "flag_breakdown": {
-                "wrapped_securities": len([f for f in all_flags if f.get("flag") in ["POTENTIAL_WRAPPED_SECURITY", "LARGE_STABLECOIN_MOVEMENT"]]),
-                "timing_suspicious": len([f for f in all_flags if f.get("flag") in ["MARKET_HOURS_TIMING", "OPTIONS_EXPIRY_TIMING"]]),
+                "wrapped_securities": wrapped_count,
+                "timing_suspicious": timing_count,
             }
         }
     except Exception as e:
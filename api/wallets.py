@@ -6,18 +6,31 @@ All addresses are publicly verified via Etherscan, XRPSCAN, or official disclosu
 Holdings fetched LIVE from chain explorers - no stored/mock data.
 """
 
+import asyncio
+import hashlib
 import os
+import re
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple, Union
 
 import httpx
-from fastapi import APIRouter, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
 
-router = APIRouter()
+from app.redis_utils import get_redis, REDIS_ENABLED
+from utils.responses import ORJSONResponse
+
+router = APIRouter(default_response_class=ORJSONResponse)
 
 ETHERSCAN_API_KEY = os.getenv("ETHERSCAN_API_KEY", "")
 ALCHEMY_API_KEY = os.getenv("ALCHEMY_API_KEY", "")
 
+_ETH_ADDR_RE = re.compile(r"0x[0-9a-fA-F]{40}").fullmatch
+_XRPL_ADDR_RE = re.compile(r"r[1-9A-HJ-NP-Za-km-z]{24,34}").fullmatch
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -242,13 +255,125 @@ KNOWN_WALLETS: List[Dict[str, Any]] = [
 ]
 
 
+# Wallet metadata is static per deploy; let clients and CDNs revalidate cheaply
+_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=600"
+
+
+def _etag(content: bytes) -> str:
+    return f'W/"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    inm = request.headers.get("if-none-match")
+    if not inm:
+        return False
+    return any(t.strip() in (etag, "*") for t in inm.split(","))
+
+
+def _index_by(field: str) -> Mapping[str, FrozenSet[int]]:
+    index: Dict[str, Set[int]] = {}
+    for i, w in enumerate(KNOWN_WALLETS):
+        index.setdefault(w[field].lower(), set()).add(i)
+    return MappingProxyType({k: frozenset(v) for k, v in index.items()})
+
+
+# Column indexes over KNOWN_WALLETS positions, built once at import and read-only
+_BY_ENTITY = _index_by("entity")
+_BY_CHAIN = _index_by("chain")
+_BY_TYPE = _index_by("type")
+_ALL_IDS: FrozenSet[int] = frozenset(range(len(KNOWN_WALLETS)))
+_VERIFIED_IDS: FrozenSet[int] = frozenset(i for i, w in enumerate(KNOWN_WALLETS) if w.get("verified", False))
+_BY_ADDR: Dict[str, Dict[str, Any]] = {w["address"].lower(): w for w in KNOWN_WALLETS}
+_DETAIL_ETAGS: Dict[str, str] = {addr: _etag(orjson.dumps(w)) for addr, w in _BY_ADDR.items()}
+
+
+def _build_entities_summary() -> Dict[str, Dict[str, Any]]:
+    summary: Dict[str, Dict[str, Any]] = {}
+    for w in KNOWN_WALLETS:
+        ent = summary.setdefault(w["entity"], {"count": 0, "chains": []})
+        ent["count"] += 1
+        if w["chain"] not in ent["chains"]:
+            ent["chains"].append(w["chain"])
+    return summary
+
+
+_ENTITIES_SUMMARY = _build_entities_summary()
+
+
+def _ids_matching(index: Mapping[str, FrozenSet[int]], keys: FrozenSet[str]) -> Set[int]:
+    ids: Set[int] = set()
+    for key in keys:
+        ids |= index.get(key, frozenset())
+    return ids
+
+
+_TS_PLACEHOLDER = b"__TS__"
+_CsvKey = Optional[FrozenSet[str]]
+
+
+@lru_cache(maxsize=256)
+def _parse_csv(value: str) -> FrozenSet[str]:
+    return frozenset(v.strip().lower() for v in value.split(",") if v.strip())
+
+
+def _csv_key(value: Optional[str]) -> _CsvKey:
+    """Normalized, order-independent cache key for a comma-separated filter."""
+    if not value:
+        return None
+    return _parse_csv(value)
+
+
+@lru_cache(maxsize=64)
+def _filter_ids(entities: _CsvKey, chains: _CsvKey, types: _CsvKey, verified_only: bool) -> Tuple[int, ...]:
+    """KNOWN_WALLETS positions matching one filter combination, in list order."""
+    ids = _ALL_IDS
+    
+    # Apply filters
+    if entities is not None:
+        ids &= _ids_matching(_BY_ENTITY, entities)
+    
+    if chains is not None:
+        ids &= _ids_matching(_BY_CHAIN, chains)
+    
+    if types is not None:
+        ids &= _ids_matching(_BY_TYPE, types)
+    
+    if verified_only:
+        ids &= _VERIFIED_IDS
+    
+    return tuple(sorted(ids))
+
+
+_LIST_NOTE = "Holdings not stored - use chain explorers for live balances. Citadel operates via partners, no direct addresses public."
+
+
+@lru_cache(maxsize=64)
+def _build_list_payload(entities: _CsvKey, chains: _CsvKey, types: _CsvKey, verified_only: bool) -> Tuple[bytes, str]:
+    """Serialized /wallets body for one filter combination, with updated_at left as a placeholder, and its ETag."""
+    wallets = [KNOWN_WALLETS[i] for i in _filter_ids(entities, chains, types, verified_only)]
+    
+    body = orjson.dumps({
+        "updated_at": _TS_PLACEHOLDER.decode(),
+        "total": len(wallets),
+        "wallets": wallets,
+        "entities_summary": _ENTITIES_SUMMARY,
+        "note": _LIST_NOTE,
+    })
+    return body, _etag(body)
+
+
+# Prebuild the unfiltered default view served to most dashboard polls
+_build_list_payload(None, None, None, True)
+
+
 @router.get("/wallets")
 async def list_wallets(
+    request: Request,
     entity: Optional[str] = Query(None, description="Filter by entity: binance, ripple, gsr, cumberland, wintermute, coinbase, kraken"),
     chain: Optional[str] = Query(None, description="Filter by chain: ethereum, xrpl"),
     wallet_type: Optional[str] = Query(None, description="Filter by type: hot_wallet, cold_wallet, escrow, trading"),
     verified_only: bool = Query(True, description="Only return verified addresses"),
-) -> Dict[str, Any]:
+) -> Response:
     """
     List known institutional wallets.
     
@@ -257,49 +382,99 @@ async def list_wallets(
     
     NOTE: Holdings are NOT stored - use Etherscan/XRPSCAN APIs for live balances.
     """
-    wallets = KNOWN_WALLETS.copy()
-    
-    # Apply filters
-    if entity:
-        entities = [e.strip().lower() for e in entity.split(",")]
-        wallets = [w for w in wallets if w["entity"].lower() in entities]
-    
-    if chain:
-        chains = [c.strip().lower() for c in chain.split(",")]
-        wallets = [w for w in wallets if w["chain"].lower() in chains]
-    
-    if wallet_type:
-        types = [t.strip().lower() for t in wallet_type.split(",")]
-        wallets = [w for w in wallets if w["type"].lower() in types]
-    
-    if verified_only:
-        wallets = [w for w in wallets if w.get("verified", False)]
-    
-    # Get unique entities for summary
-    entities_summary = {}
-    for w in KNOWN_WALLETS:
-        ent = w["entity"]
-        if ent not in entities_summary:
-            entities_summary[ent] = {"count": 0, "chains": set()}
-        entities_summary[ent]["count"] += 1
-        entities_summary[ent]["chains"].add(w["chain"])
-    
-    # Convert sets to lists for JSON
-    for ent in entities_summary:
-        entities_summary[ent]["chains"] = list(entities_summary[ent]["chains"])
-    
-    return {
-        "updated_at": _now_iso(),
-        "total": len(wallets),
-        "wallets": wallets,
-        "entities_summary": entities_summary,
-        "note": "Holdings not stored - use chain explorers for live balances. Citadel operates via partners, no direct addresses public."
-    }
+    # KNOWN_WALLETS is static, so each filter combination serializes once
+    body, etag = _build_list_payload(_csv_key(entity), _csv_key(chain), _csv_key(wallet_type), verified_only)
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=body.replace(_TS_PLACEHOLDER, _now_iso().encode(), 1),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 # NOTE: More specific routes MUST come before the generic /{address} route
 
 
+_ETHERSCAN_API = "https://api.etherscan.io/api"
+_ALCHEMY_API = "https://eth-mainnet.alchemyapi.io/v2/"
+
+# Shared HTTP client for explorer balance calls (keep-alive reuse, HTTP/2 multiplexing)
+_http_client: Optional[httpx.AsyncClient] = None
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared pooled HTTP client"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(timeout=15, limits=_HTTP_LIMITS, http2=True)
+    return _http_client
+
+
+async def shutdown() -> None:
+    """Close the shared HTTP client; called once from app.main's lifespan"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# Etherscan balancemulti accepts at most 20 addresses per call
+_BALANCEMULTI_MAX = 20
+# Caps concurrent per-wallet balance requests (free-tier explorer rate limits)
+_balance_semaphore = asyncio.Semaphore(5)
+
+
+async def _etherscan_balances(client: httpx.AsyncClient, addresses: List[str]) -> Dict[str, int]:
+    """Wei balances for up to 20 addresses in one Etherscan call, keyed by lowercased address."""
+    resp = await client.get(_ETHERSCAN_API, params={
+        "module": "account",
+        "action": "balancemulti",
+        "address": ",".join(addresses),
+        "tag": "latest",
+        "apikey": ETHERSCAN_API_KEY,
+    })
+    data = resp.json()
+    if data.get("status") != "1":
+        return {}
+    return {str(r["account"]).lower(): int(r["balance"]) for r in data.get("result") or []}
+
+
+# Explorer balances cached in Redis so polling dashboards don't re-query upstream
+_BALANCE_CACHE_TTL = 15
+
+
+async def _cached_balances(addresses: List[str]) -> Dict[str, int]:
+    """Cached wei balances for the given addresses, keyed by lowercased address (hits only)."""
+    if not REDIS_ENABLED or not addresses:
+        return {}
+    keys = [a.lower() for a in addresses]
+    try:
+        r = await get_redis()
+        async with r.pipeline(transaction=False) as pipe:
+            for k in keys:
+                pipe.get(f"ethbal:{k}")
+            values = await pipe.execute()
+    except Exception:
+        return {}
+    return {k: int(v) for k, v in zip(keys, values) if v is not None}
+
+
+async def _store_balances(wei_by_addr: Dict[str, int]) -> None:
+    if not REDIS_ENABLED or not wei_by_addr:
+        return
+    try:
+        r = await get_redis()
+        async with r.pipeline(transaction=False) as pipe:
+            for addr, wei in wei_by_addr.items():
+                pipe.set(f"ethbal:{addr}", str(wei), ex=_BALANCE_CACHE_TTL)
+            await pipe.execute()
+    except Exception:
+        pass
+
+
 @router.get("/wallets/entity/{entity_name}/balances")
 async def get_entity_balances(entity_name: str) -> Dict[str, Any]:
     """
@@ -325,72 +500,69 @@ async def get_entity_balances(entity_name: str) -> Dict[str, Any]:
             "updated_at": _now_iso()
         }
     
-    balances = []
-    total_eth = 0.0
-    
-    async with httpx.AsyncClient(timeout=15) as client:
-        for wallet in entity_wallets:
-            balance_fetched = False
-
-            # Try Etherscan first
-            if ETHERSCAN_API_KEY:
-                try:
-                    url = f"https://api.etherscan.io/api?module=account&action=balance&address={wallet['address']}&tag=latest&apikey={ETHERSCAN_API_KEY}"
-                    resp = await client.get(url)
-                    data = resp.json()
-
-                    if data.get("status") == "1":
-                        balance_wei = int(data.get("result", 0))
-                        balance_eth = balance_wei / 1e18
-                        total_eth += balance_eth
-
-                        balances.append({
-                            "address": wallet["address"],
-                            "label": wallet.get("label"),
-                            "type": wallet.get("type"),
-                            "balance_eth": balance_eth
-                        })
-                        balance_fetched = True
-                except Exception:
-                    pass  # Continue to Alchemy fallback
-
-            # Try Alchemy as fallback if Etherscan failed or unavailable
-            if not balance_fetched and ALCHEMY_API_KEY:
-                try:
-                    url = f"https://eth-mainnet.alchemyapi.io/v2/{ALCHEMY_API_KEY}"
-                    payload = {
-                        "jsonrpc": "2.0",
-                        "method": "eth_getBalance",
-                        "params": [wallet["address"], "latest"],
-                        "id": 1
-                    }
-                    resp = await client.post(url, json=payload)
-                    data = resp.json()
-
-                    if "result" in data:
-                        balance_wei = int(data["result"], 16)
-                        balance_eth = balance_wei / 1e18
-                        total_eth += balance_eth
-
-                        balances.append({
-                            "address": wallet["address"],
-                            "label": wallet.get("label"),
-                            "type": wallet.get("type"),
-                            "balance_eth": balance_eth
-                        })
-                        balance_fetched = True
-                except Exception as e:
-                    balances.append({
-                        "address": wallet["address"],
-                        "label": wallet.get("label"),
-                        "error": f"Both APIs failed: {str(e)}"
-                    })
-            elif not balance_fetched:
-                balances.append({
+    client = get_http_client()
+
+    # Cached balances first, then Etherscan for the misses: one balancemulti call per 20 wallets
+    known_wei = await _cached_balances([w["address"] for w in entity_wallets])
+    fetched_wei: Dict[str, int] = {}
+    if ETHERSCAN_API_KEY:
+        addresses = [w["address"] for w in entity_wallets if w["address"].lower() not in known_wei]
+        chunks = [addresses[i:i + _BALANCEMULTI_MAX] for i in range(0, len(addresses), _BALANCEMULTI_MAX)]
+        for part in await asyncio.gather(*(_etherscan_balances(client, c) for c in chunks), return_exceptions=True):
+            if isinstance(part, dict):
+                fetched_wei.update(part)
+    known_wei.update(fetched_wei)
+
+    async def _fetch(wallet: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        balance_wei = known_wei.get(wallet["address"].lower())
+        if balance_wei is not None:
+            return {
+                "address": wallet["address"],
+                "label": wallet.get("label"),
+                "type": wallet.get("type"),
+                "balance_eth": balance_wei / 1e18
+            }
+
+        # Try Alchemy as fallback if Etherscan failed or unavailable
+        if not ALCHEMY_API_KEY:
+            return {
+                "address": wallet["address"],
+                "label": wallet.get("label"),
+                "error": "No API keys configured for balance fetching"
+            }
+        try:
+            url = f"{_ALCHEMY_API}{ALCHEMY_API_KEY}"
+            payload = {
+                "jsonrpc": "2.0",
+                "method": "eth_getBalance",
+                "params": [wallet["address"], "latest"],
+                "id": 1
+            }
+            async with _balance_semaphore:
+                resp = await client.post(url, json=payload)
+            data = resp.json()
+            if "result" in data:
+                balance_wei = int(data["result"], 16)
+                fetched_wei[wallet["address"].lower()] = balance_wei
+                return {
                     "address": wallet["address"],
                     "label": wallet.get("label"),
-                    "error": "No API keys configured for balance fetching"
-                })
+                    "type": wallet.get("type"),
+                    "balance_eth": balance_wei / 1e18
+                }
+        except Exception as e:
+            return {
+                "address": wallet["address"],
+                "label": wallet.get("label"),
+                "error": f"Both APIs failed: {str(e)}"
+            }
+        return None
+
+    results = await asyncio.gather(*(_fetch(w) for w in entity_wallets))
+    balances = [b for b in results if b is not None]
+    await _store_balances(fetched_wei)
+    
+    total_eth = sum((b["balance_eth"] for b in balances if "balance_eth" in b), 0.0)
     
     return {
         "entity": entity_name,
@@ -414,7 +586,7 @@ async def get_wallet_balance(address: str) -> Dict[str, Any]:
     addr_lower = address.lower()
     
     # Check if XRPL address
-    if address.startswith("r") and len(address) > 25:
+    if _XRPL_ADDR_RE(address):
         return {
             "address": address,
             "chain": "xrpl",
@@ -423,6 +595,9 @@ async def get_wallet_balance(address: str) -> Dict[str, Any]:
             "updated_at": _now_iso()
         }
     
+    if not _ETH_ADDR_RE(address):
+        raise HTTPException(status_code=400, detail="Invalid Ethereum or XRPL address")
+    
     # Ethereum address - fetch from Etherscan or Alchemy
     if not ETHERSCAN_API_KEY and not ALCHEMY_API_KEY:
         return {
@@ -433,80 +608,91 @@ async def get_wallet_balance(address: str) -> Dict[str, Any]:
         }
     
     # Get wallet metadata if known
-    wallet_meta = None
-    for w in KNOWN_WALLETS:
-        if w["address"].lower() == addr_lower:
-            wallet_meta = w
-            break
+    wallet_meta = _BY_ADDR.get(addr_lower)
     
     balance_fetched = False
     balance_wei = 0
     source = ""
 
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            # Try Etherscan first
-            if ETHERSCAN_API_KEY:
-                try:
-                    url = f"https://api.etherscan.io/api?module=account&action=balance&address={address}&tag=latest&apikey={ETHERSCAN_API_KEY}"
-                    resp = await client.get(url)
-                    data = resp.json()
-
-                    if data.get("status") == "1":
-                        balance_wei = int(data.get("result", 0))
-                        balance_fetched = True
-                        source = "Etherscan API (live)"
-                except Exception:
-                    pass  # Continue to Alchemy fallback
-
-            # Try Alchemy if Etherscan failed
-            if not balance_fetched and ALCHEMY_API_KEY:
-                try:
-                    url = f"https://eth-mainnet.alchemyapi.io/v2/{ALCHEMY_API_KEY}"
-                    payload = {
-                        "jsonrpc": "2.0",
-                        "method": "eth_getBalance",
-                        "params": [address, "latest"],
-                        "id": 1
-                    }
-                    resp = await client.post(url, json=payload)
-                    data = resp.json()
-
-                    if "result" in data:
-                        balance_wei = int(data["result"], 16)
-                        balance_fetched = True
-                        source = "Alchemy API (live)"
-                except Exception:
-                    pass
-
-            if not balance_fetched:
-                return {
+        client = get_http_client()
+
+        cached = (await _cached_balances([address])).get(addr_lower)
+        if cached is not None:
+            balance_wei = cached
+            balance_fetched = True
+            source = "Explorer API (cached)"
+
+        # Try Etherscan first
+        if not balance_fetched and ETHERSCAN_API_KEY:
+            try:
+                resp = await client.get(_ETHERSCAN_API, params={
+                    "module": "account",
+                    "action": "balance",
                     "address": address,
-                    "chain": "ethereum",
-                    "error": "Both Etherscan and Alchemy APIs failed to fetch balance",
-                    "updated_at": _now_iso()
+                    "tag": "latest",
+                    "apikey": ETHERSCAN_API_KEY,
+                }, timeout=10)
+                data = resp.json()
+
+                if data.get("status") == "1":
+                    balance_wei = int(data.get("result", 0))
+                    balance_fetched = True
+                    source = "Etherscan API (live)"
+            except Exception:
+                pass  # Continue to Alchemy fallback
+
+        # Try Alchemy if Etherscan failed
+        if not balance_fetched and ALCHEMY_API_KEY:
+            try:
+                url = f"{_ALCHEMY_API}{ALCHEMY_API_KEY}"
+                payload = {
+                    "jsonrpc": "2.0",
+                    "method": "eth_getBalance",
+                    "params": [address, "latest"],
+                    "id": 1
                 }
+                resp = await client.post(url, json=payload, timeout=10)
+                data = resp.json()
 
-            # Convert Wei to ETH
-            balance_eth = balance_wei / 1e18
+                if "result" in data:
+                    balance_wei = int(data["result"], 16)
+                    balance_fetched = True
+                    source = "Alchemy API (live)"
+            except Exception:
+                pass
 
-            result = {
+        if not balance_fetched:
+            return {
                 "address": address,
                 "chain": "ethereum",
-                "balance_eth": balance_eth,
-                "balance_wei": str(balance_wei),
-                "updated_at": _now_iso(),
-                "source": source,
-                "etherscan_url": f"https://etherscan.io/address/{address}"
+                "error": "Both Etherscan and Alchemy APIs failed to fetch balance",
+                "updated_at": _now_iso()
             }
-            
-            if wallet_meta:
-                result["label"] = wallet_meta.get("label")
-                result["entity"] = wallet_meta.get("entity")
-                result["type"] = wallet_meta.get("type")
-            
-            return result
-            
+
+        if cached is None:
+            await _store_balances({addr_lower: balance_wei})
+
+        # Convert Wei to ETH
+        balance_eth = balance_wei / 1e18
+
+        result = {
+            "address": address,
+            "chain": "ethereum",
+            "balance_eth": balance_eth,
+            "balance_wei": str(balance_wei),
+            "updated_at": _now_iso(),
+            "source": source,
+            "etherscan_url": f"https://etherscan.io/address/{address}"
+        }
+        
+        if wallet_meta:
+            result["label"] = wallet_meta.get("label")
+            result["entity"] = wallet_meta.get("entity")
+            result["type"] = wallet_meta.get("type")
+        
+        return result
+        
     except Exception as e:
         return {
             "address": address,
@@ -517,24 +703,27 @@ async def get_wallet_balance(address: str) -> Dict[str, Any]:
 
 
 # Generic address lookup - MUST be last as it catches all /{address} patterns
-@router.get("/wallets/{address}")
-async def get_wallet_detail(address: str) -> Dict[str, Any]:
+# response_model=None: the Dict | Response union isn't a pydantic response model
+@router.get("/wallets/{address}", response_model=None)
+async def get_wallet_detail(address: str, request: Request, response: Response) -> Union[Dict[str, Any], Response]:
     """
     Get details for a specific wallet address.
     
     Returns cached metadata only - for live balances, use Etherscan/XRPSCAN APIs directly.
     """
-    # Normalize address for comparison
     addr_lower = address.lower()
-    
-    for wallet in KNOWN_WALLETS:
-        if wallet["address"].lower() == addr_lower:
-            return {
-                "found": True,
-                "wallet": wallet,
-                "updated_at": _now_iso(),
-                "note": "For live balance, query Etherscan/XRPSCAN directly"
-            }
+    wallet = _BY_ADDR.get(addr_lower)
+    if wallet is not None:
+        headers = {"ETag": _DETAIL_ETAGS[addr_lower], "Cache-Control": _CACHE_CONTROL}
+        if _etag_matches(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+        return {
+            "found": True,
+            "wallet": wallet,
+            "updated_at": _now_iso(),
+            "note": "For live balance, query Etherscan/XRPSCAN directly"
+        }
     
     return {
         "found": False,
@@ -1,24 +1,29 @@
 import os
+import sys
 from pathlib import Path
-try:
-    from dotenv import load_dotenv  # type: ignore
-    load_dotenv()
-except Exception:
-    env_path = Path(__file__).resolve().parent.parent / ".env"
-    if env_path.exists():
+
+# Resolve the project .env once; load_dotenv() with no path walks up from the caller's frame
+_ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+# Set once .env has been applied; child processes inherit os.environ and skip the re-parse
+_ENV_LOADED_FLAG = "_XRPFLOW_ENV_LOADED"
+if os.environ.get(_ENV_LOADED_FLAG) != "1" and _ENV_PATH.is_file():
+    try:
+        from dotenv import load_dotenv  # type: ignore
+        load_dotenv(_ENV_PATH)
+    except Exception:
         try:
-            with env_path.open() as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, val = line.split("=", 1)
-                    key = key.strip()
-                    val = val.strip()
-                    if key and key not in os.environ:
-                        os.environ[key] = val
+            for line in _ENV_PATH.read_text().splitlines():
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, val = line.split("=", 1)
+                key = key.strip()
+                val = val.strip()
+                if key and key not in os.environ:
+                    os.environ[key] = val
         except Exception:
             pass
+    os.environ[_ENV_LOADED_FLAG] = "1"
 
 # Import configuration fixes for production deployment
 try:
@@ -27,38 +32,76 @@ except ImportError:
     def fix_yahoo_symbol(symbol: str) -> str:
         return symbol
 
-APP_ENV = os.getenv("APP_ENV", "dev")
-DISABLE_EQUITY_FALLBACK = os.getenv("DISABLE_EQUITY_FALLBACK", "false").lower() == "true"
-APP_VERSION = os.getenv("APP_VERSION", "1.0.0")
-
-XRPL_WSS = os.getenv("XRPL_WSS", "")
-ALCHEMY_WS_URL = os.getenv("ALCHEMY_WS_URL", "")
-ALCHEMY_API_KEY = os.getenv("ALCHEMY_API_KEY", "")
-FINNHUB_API_KEY = os.getenv("FINNHUB_API_KEY", "")
-POLYGON_API_KEY = os.getenv("POLYGON_API_KEY", "")
-ALPHA_VANTAGE_API_KEY = os.getenv("ALPHA_VANTAGE_API_KEY", "")
-DATABENTO_API_KEY = os.getenv("DATABENTO_API_KEY", "")
-ETHERSCAN_API_KEY = os.getenv("ETHERSCAN_API_KEY", "")
-NANSEN_API_KEY = os.getenv("NANSEN_API_KEY", "")
-DUNE_API_KEY = os.getenv("DUNE_API_KEY", "")
+_env = os.environ.get
+
+
+def _int(name: str, default: int) -> int:
+    raw = _env(name, default)
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {raw!r}") from None
+
+
+def _float(name: str, default: float) -> float:
+    raw = _env(name, default)
+    try:
+        return float(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {raw!r}") from None
+
+
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
+
+def _bool(name: str, default: bool) -> bool:
+    raw = _env(name)
+    if raw is None:
+        return default
+    return raw in _TRUTHY or raw.lower() in _TRUTHY
+
+
+def _csv(name: str, default: str = "", lower: bool = False) -> tuple:
+    """Comma-separated env var as a tuple of stripped, non-empty, interned items."""
+    items = filter(None, map(str.strip, _env(name, default).split(",")))
+    if lower:
+        items = map(str.lower, items)
+    return tuple(map(sys.intern, items))
+
+
+APP_ENV = _env("APP_ENV", "dev")
+DISABLE_EQUITY_FALLBACK = _bool("DISABLE_EQUITY_FALLBACK", False)
+APP_VERSION = _env("APP_VERSION", "1.0.0")
+
+XRPL_WSS = _env("XRPL_WSS", "")
+ALCHEMY_WS_URL = _env("ALCHEMY_WS_URL", "")
+ALCHEMY_API_KEY = _env("ALCHEMY_API_KEY", "")
+FINNHUB_API_KEY = _env("FINNHUB_API_KEY", "")
+POLYGON_API_KEY = _env("POLYGON_API_KEY", "")
+ALPHA_VANTAGE_API_KEY = _env("ALPHA_VANTAGE_API_KEY", "")
+ALPHA_VANTAGE_RPM = _int("ALPHA_VANTAGE_RPM", 5)  # free tier: 5 req/min
+DATABENTO_API_KEY = _env("DATABENTO_API_KEY", "")
+ETHERSCAN_API_KEY = _env("ETHERSCAN_API_KEY", "")
+NANSEN_API_KEY = _env("NANSEN_API_KEY", "")
+DUNE_API_KEY = _env("DUNE_API_KEY", "")
 
 # Whale Alert for real-time large transaction tracking
-WHALE_ALERT_API_KEY = os.getenv("WHALE_ALERT_API_KEY", "")
+WHALE_ALERT_API_KEY = _env("WHALE_ALERT_API_KEY", "")
 
-ALERTS_SLACK_WEBHOOK = os.getenv("ALERTS_SLACK_WEBHOOK", "")
-ALERTS_DEDUP_TTL_SECONDS = int(os.getenv("ALERTS_DEDUP_TTL_SECONDS", "300"))
-ALERTS_RATE_WINDOW_SECONDS = int(os.getenv("ALERTS_RATE_WINDOW_SECONDS", "60"))
-ALERTS_RATE_MAX_PER_WINDOW = int(os.getenv("ALERTS_RATE_MAX_PER_WINDOW", "30"))
-ALERTS_RATE_LIMIT_PER_CATEGORY = os.getenv("ALERTS_RATE_LIMIT_PER_CATEGORY", "false").lower() == "true"
+ALERTS_SLACK_WEBHOOK = _env("ALERTS_SLACK_WEBHOOK", "")
+ALERTS_DEDUP_TTL_SECONDS = _int("ALERTS_DEDUP_TTL_SECONDS", 300)
+ALERTS_RATE_WINDOW_SECONDS = _int("ALERTS_RATE_WINDOW_SECONDS", 60)
+ALERTS_RATE_MAX_PER_WINDOW = _int("ALERTS_RATE_MAX_PER_WINDOW", 30)
+ALERTS_RATE_LIMIT_PER_CATEGORY = _bool("ALERTS_RATE_LIMIT_PER_CATEGORY", False)
 
-DATABASE_URL = os.getenv("DATABASE_URL", "")
+DATABASE_URL = _env("DATABASE_URL", "")
 
-POSTGRES_HOST = os.getenv("POSTGRES_HOST", "db")
-POSTGRES_PORT = int(os.getenv("POSTGRES_PORT", "5432"))
-POSTGRES_DB = os.getenv("POSTGRES_DB", "xrpflow")
-POSTGRES_USER = os.getenv("POSTGRES_USER", "xrpflow")
-POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "password")
-POSTGRES_SSLMODE = os.getenv("POSTGRES_SSLMODE", "require")
+POSTGRES_HOST = _env("POSTGRES_HOST", "db")
+POSTGRES_PORT = _int("POSTGRES_PORT", 5432)
+POSTGRES_DB = _env("POSTGRES_DB", "xrpflow")
+POSTGRES_USER = _env("POSTGRES_USER", "xrpflow")
+POSTGRES_PASSWORD = _env("POSTGRES_PASSWORD", "password")
+POSTGRES_SSLMODE = _env("POSTGRES_SSLMODE", "require")
 
 if DATABASE_URL:
     try:
@@ -79,144 +122,142 @@ if DATABASE_URL:
     except Exception:
         pass
 # Redis URL - empty string disables Redis (graceful degradation)
-_redis_url = os.getenv("REDIS_URL", "")
+_redis_url = _env("REDIS_URL", "")
 REDIS_URL = _redis_url if _redis_url.startswith(("redis://", "rediss://", "unix://")) else ""
 
-EQUITY_TICKERS = [t.strip() for t in os.getenv("EQUITY_TICKERS", "AAPL,MSFT,TSLA").split(",") if t.strip()]
-VERIFIER_ALLOWLIST = [a.strip().lower() for a in os.getenv("VERIFIER_ALLOWLIST", "").split(",") if a.strip()]
+EQUITY_TICKERS = _csv("EQUITY_TICKERS", "AAPL,MSFT,TSLA")
+VERIFIER_ALLOWLIST = frozenset(_csv("VERIFIER_ALLOWLIST", lower=True))
 
-SENTRY_DSN = os.getenv("SENTRY_DSN", "")
+SENTRY_DSN = _env("SENTRY_DSN", "")
 
 # Equities detection threshold (shares)
-EQUITY_BLOCK_MIN_SHARES = int(os.getenv("EQUITY_BLOCK_MIN_SHARES", "100000"))
+EQUITY_BLOCK_MIN_SHARES = _int("EQUITY_BLOCK_MIN_SHARES", 100000)
 
 # Pricing (Coingecko) - Use Pro API if key is set
-COINGECKO_API_KEY = os.getenv("COINGECKO_API_KEY", "")
+COINGECKO_API_KEY = _env("COINGECKO_API_KEY", "")
 _DEFAULT_CG_BASE = "https://pro-api.coingecko.com/api/v3" if COINGECKO_API_KEY else "https://api.coingecko.com/api/v3"
-COINGECKO_API_BASE = os.getenv("COINGECKO_API_BASE", _DEFAULT_CG_BASE)
+COINGECKO_API_BASE = _env("COINGECKO_API_BASE", _DEFAULT_CG_BASE)
 
 # Correlation dedup
-CROSS_SIGNAL_DEDUP_TTL = int(os.getenv("CROSS_SIGNAL_DEDUP_TTL", "21600"))  # 6h
+CROSS_SIGNAL_DEDUP_TTL = _int("CROSS_SIGNAL_DEDUP_TTL", 21600)  # 6h
 
-# GoDark XRPL integration
-GODARK_XRPL_PARTNERS = [a.strip().lower() for a in os.getenv("GODARK_XRPL_PARTNERS", "").split(",") if a.strip()]
-GODARK_XRPL_DEST_TAGS = [int(x.strip()) for x in os.getenv("GODARK_XRPL_DEST_TAGS", "").split(",") if x.strip().isdigit()]
-GODARK_ETH_PARTNERS = [a.strip().lower() for a in os.getenv("GODARK_ETH_PARTNERS", "").split(",") if a.strip()]
-ARKHAM_API_KEY = os.getenv("ARKHAM_API_KEY", "")
-GODARK_DYNAMIC_REFRESH_SECONDS = int(os.getenv("GODARK_DYNAMIC_REFRESH_SECONDS", "3600"))
+# GoDark integration (partner/tag sets are membership-checked per event)
+GODARK_XRPL_PARTNERS = frozenset(_csv("GODARK_XRPL_PARTNERS", lower=True))
+GODARK_XRPL_DEST_TAGS = frozenset(int(x) for x in _csv("GODARK_XRPL_DEST_TAGS") if x.isdigit())
+GODARK_ETH_PARTNERS = frozenset(_csv("GODARK_ETH_PARTNERS", lower=True))
+ARKHAM_API_KEY = _env("ARKHAM_API_KEY", "")
+GODARK_DYNAMIC_REFRESH_SECONDS = _int("GODARK_DYNAMIC_REFRESH_SECONDS", 3600)
 
-# Trustline watcher configuration
-TRUSTLINE_WATCHED_ISSUERS = [a.strip() for a in os.getenv("TRUSTLINE_WATCHED_ISSUERS", "").split(",") if a.strip()]
-GODARK_TRUSTLINE_MIN_VALUE = float(os.getenv("GODARK_TRUSTLINE_MIN_VALUE", "10000000"))
-MONSTER_TRUSTLINE_THRESHOLD = float(os.getenv("MONSTER_TRUSTLINE_THRESHOLD", "100000000"))
+# Trustline watcher configuration (issuers are matched lowercased, like GoDark partners)
+TRUSTLINE_WATCHED_ISSUERS = frozenset(_csv("TRUSTLINE_WATCHED_ISSUERS", lower=True))
+GODARK_TRUSTLINE_MIN_VALUE = _float("GODARK_TRUSTLINE_MIN_VALUE", 10000000)
+MONSTER_TRUSTLINE_THRESHOLD = _float("MONSTER_TRUSTLINE_THRESHOLD", 100000000)
 
 # Ethereum GoDark prep scanner
-ENABLE_GODARK_ETH_SCANNER = os.getenv("ENABLE_GODARK_ETH_SCANNER", "true").lower() == "true"
+ENABLE_GODARK_ETH_SCANNER = _bool("ENABLE_GODARK_ETH_SCANNER", True)
 
 # Renegade ZK dark pool detection (Ethereum)
-RENEGADE_VERIFIER = os.getenv("RENEGADE_VERIFIER", "").lower()
-RENEGADE_MANAGER = os.getenv("RENEGADE_MANAGER", "").lower()
+RENEGADE_VERIFIER = _env("RENEGADE_VERIFIER", "").lower()
+RENEGADE_MANAGER = _env("RENEGADE_MANAGER", "").lower()
 
 # Penumbra shielded pool detection (Cosmos)
-PENUMBRA_UNSHIELD_MIN_USD = float(os.getenv("PENUMBRA_UNSHIELD_MIN_USD", "10000000"))
+PENUMBRA_UNSHIELD_MIN_USD = _float("PENUMBRA_UNSHIELD_MIN_USD", 10000000)
 
 # Secret Network shielded pool detection (Cosmos)
-SECRET_UNSHIELD_MIN_USD = float(os.getenv("SECRET_UNSHIELD_MIN_USD", "5000000"))
+SECRET_UNSHIELD_MIN_USD = _float("SECRET_UNSHIELD_MIN_USD", 5000000)
 
 # Execution stubs (disabled by default)
-EXECUTION_ENABLED = os.getenv("EXECUTION_ENABLED", "false").lower() == "true"
-EXECUTION_DRY_RUN = os.getenv("EXECUTION_DRY_RUN", "true").lower() == "true"
-EXECUTION_MAX_SLIPPAGE_PCT = float(os.getenv("EXECUTION_MAX_SLIPPAGE_PCT", "0.5"))
+EXECUTION_ENABLED = _bool("EXECUTION_ENABLED", False)
+EXECUTION_DRY_RUN = _bool("EXECUTION_DRY_RUN", True)
+EXECUTION_MAX_SLIPPAGE_PCT = _float("EXECUTION_MAX_SLIPPAGE_PCT", 0.5)
 
 # Risk controls
-RISK_MAX_PCT_OF_SIGNAL = float(os.getenv("RISK_MAX_PCT_OF_SIGNAL", "1.0"))
-RISK_DAILY_PNL_USD = float(os.getenv("RISK_DAILY_PNL_USD", "100000"))
-RISK_MAX_VOL_BPS = int(os.getenv("RISK_MAX_VOL_BPS", "300"))
+RISK_MAX_PCT_OF_SIGNAL = _float("RISK_MAX_PCT_OF_SIGNAL", 1.0)
+RISK_DAILY_PNL_USD = _float("RISK_DAILY_PNL_USD", 100000)
+RISK_MAX_VOL_BPS = _int("RISK_MAX_VOL_BPS", 300)
 
 # Execution circuit breaker
-CIRCUIT_BREAKER_LOSSES = int(os.getenv("CIRCUIT_BREAKER_LOSSES", "3"))
-CIRCUIT_BREAKER_COOLDOWN_SECONDS = int(os.getenv("CIRCUIT_BREAKER_COOLDOWN_SECONDS", "3600"))
+CIRCUIT_BREAKER_LOSSES = _int("CIRCUIT_BREAKER_LOSSES", 3)
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = _int("CIRCUIT_BREAKER_COOLDOWN_SECONDS", 3600)
 
 # ML inference circuit breaker
-ML_CIRCUIT_BREAKER_FAILURES = int(os.getenv("ML_CIRCUIT_BREAKER_FAILURES", "5"))
-ML_CIRCUIT_BREAKER_COOLDOWN_SECONDS = int(os.getenv("ML_CIRCUIT_BREAKER_COOLDOWN_SECONDS", "1800"))
-ML_CIRCUIT_BREAKER_ENABLED = os.getenv("ML_CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+ML_CIRCUIT_BREAKER_FAILURES = _int("ML_CIRCUIT_BREAKER_FAILURES", 5)
+ML_CIRCUIT_BREAKER_COOLDOWN_SECONDS = _int("ML_CIRCUIT_BREAKER_COOLDOWN_SECONDS", 1800)
+ML_CIRCUIT_BREAKER_ENABLED = _bool("ML_CIRCUIT_BREAKER_ENABLED", True)
 
 # RWA AMM monitor
-RWA_AMM_CHANGE_THRESHOLD_PCT = float(os.getenv("RWA_AMM_CHANGE_THRESHOLD_PCT", "5"))
+RWA_AMM_CHANGE_THRESHOLD_PCT = _float("RWA_AMM_CHANGE_THRESHOLD_PCT", 5)
 
 # DEX orderbook pairs monitor
-DEX_ORDERBOOK_PAIRS = [p.strip() for p in os.getenv("DEX_ORDERBOOK_PAIRS", "XRP/USD.rhub,XRP/USDC.rhub").split(",") if p.strip()]
+DEX_ORDERBOOK_PAIRS = _csv("DEX_ORDERBOOK_PAIRS", "XRP/USD.rhub,XRP/USDC.rhub")
 
 # SDUI surge detection
-SURGE_WINDOW_SECONDS = int(os.getenv("SURGE_WINDOW_SECONDS", "300"))
-SURGE_BURST_COUNT = int(os.getenv("SURGE_BURST_COUNT", "3"))
-SURGE_CONFIDENCE_THRESHOLD = int(os.getenv("SURGE_CONFIDENCE_THRESHOLD", "90"))
+SURGE_WINDOW_SECONDS = _int("SURGE_WINDOW_SECONDS", 300)
+SURGE_BURST_COUNT = _int("SURGE_BURST_COUNT", 3)
+SURGE_CONFIDENCE_THRESHOLD = _int("SURGE_CONFIDENCE_THRESHOLD", 90)
 
 # Solana HumidiFi dark AMM scanner
-SOLANA_RPC_URL = os.getenv("SOLANA_RPC_URL", "")
-HUMIDIFI_PROGRAM_IDS = [p.strip() for p in os.getenv("HUMIDIFI_PROGRAM_IDS", "").split(",") if p.strip()]
-SOLANA_POLL_SECONDS = int(os.getenv("SOLANA_POLL_SECONDS", "12"))
-SOLANA_BACKOFF_MAX = int(os.getenv("SOLANA_BACKOFF_MAX", "60"))
-SOLANA_PAGE_MAX = int(os.getenv("SOLANA_PAGE_MAX", "3"))
+SOLANA_RPC_URL = _env("SOLANA_RPC_URL", "")
+HUMIDIFI_PROGRAM_IDS = _csv("HUMIDIFI_PROGRAM_IDS")
+SOLANA_POLL_SECONDS = _int("SOLANA_POLL_SECONDS", 12)
+SOLANA_BACKOFF_MAX = _int("SOLANA_BACKOFF_MAX", 60)
+SOLANA_PAGE_MAX = _int("SOLANA_PAGE_MAX", 3)
 
 # On-chain subscriptions (treasuries and prices)
-SOL_TREASURY = os.getenv("SOL_TREASURY", "")
-SOL_USDC_MINT = os.getenv("SOL_USDC_MINT", "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v")
-ETH_TREASURY = os.getenv("ETH_TREASURY", "")
-ETH_USDC_ADDRESS = os.getenv("ETH_USDC_ADDRESS", "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48")
-ONCHAIN_PRO_SOL_MONTHLY = float(os.getenv("ONCHAIN_PRO_SOL_MONTHLY", "0.5"))
-ONCHAIN_PRO_SOL_ANNUAL = float(os.getenv("ONCHAIN_PRO_SOL_ANNUAL", "5.4"))
-ONCHAIN_INST_SOL_MONTHLY = float(os.getenv("ONCHAIN_INST_SOL_MONTHLY", "5.0"))
-ONCHAIN_INST_SOL_ANNUAL = float(os.getenv("ONCHAIN_INST_SOL_ANNUAL", "54.0"))
-ONCHAIN_PRO_ETH_MONTHLY = float(os.getenv("ONCHAIN_PRO_ETH_MONTHLY", "0.018"))
-ONCHAIN_PRO_ETH_ANNUAL = float(os.getenv("ONCHAIN_PRO_ETH_ANNUAL", "0.194"))
-ONCHAIN_INST_ETH_MONTHLY = float(os.getenv("ONCHAIN_INST_ETH_MONTHLY", "0.18"))
-ONCHAIN_INST_ETH_ANNUAL = float(os.getenv("ONCHAIN_INST_ETH_ANNUAL", "1.94"))
-ONCHAIN_PRO_USDC_MONTHLY = float(os.getenv("ONCHAIN_PRO_USDC_MONTHLY", "49.0"))
-ONCHAIN_INST_USDC_MONTHLY = float(os.getenv("ONCHAIN_INST_USDC_MONTHLY", "499.0"))
-ONCHAIN_POLL_SECONDS = int(os.getenv("ONCHAIN_POLL_SECONDS", "12"))
-ONCHAIN_BACKOFF_MAX = int(os.getenv("ONCHAIN_BACKOFF_MAX", "60"))
+SOL_TREASURY = _env("SOL_TREASURY", "")
+SOL_USDC_MINT = _env("SOL_USDC_MINT", "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v")
+ETH_TREASURY = _env("ETH_TREASURY", "")
+ETH_USDC_ADDRESS = _env("ETH_USDC_ADDRESS", "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48")
+ONCHAIN_PRO_SOL_MONTHLY = _float("ONCHAIN_PRO_SOL_MONTHLY", 0.5)
+ONCHAIN_PRO_SOL_ANNUAL = _float("ONCHAIN_PRO_SOL_ANNUAL", 5.4)
+ONCHAIN_INST_SOL_MONTHLY = _float("ONCHAIN_INST_SOL_MONTHLY", 5.0)
+ONCHAIN_INST_SOL_ANNUAL = _float("ONCHAIN_INST_SOL_ANNUAL", 54.0)
+ONCHAIN_PRO_ETH_MONTHLY = _float("ONCHAIN_PRO_ETH_MONTHLY", 0.018)
+ONCHAIN_PRO_ETH_ANNUAL = _float("ONCHAIN_PRO_ETH_ANNUAL", 0.194)
+ONCHAIN_INST_ETH_MONTHLY = _float("ONCHAIN_INST_ETH_MONTHLY", 0.18)
+ONCHAIN_INST_ETH_ANNUAL = _float("ONCHAIN_INST_ETH_ANNUAL", 1.94)
+ONCHAIN_PRO_USDC_MONTHLY = _float("ONCHAIN_PRO_USDC_MONTHLY", 49.0)
+ONCHAIN_INST_USDC_MONTHLY = _float("ONCHAIN_INST_USDC_MONTHLY", 499.0)
+ONCHAIN_POLL_SECONDS = _int("ONCHAIN_POLL_SECONDS", 12)
+ONCHAIN_BACKOFF_MAX = _int("ONCHAIN_BACKOFF_MAX", 60)
 
 # Push notifications (APNs/FCM)
-APNS_KEY_ID = os.getenv("APNS_KEY_ID", "")
-APNS_TEAM_ID = os.getenv("APNS_TEAM_ID", "")
-APNS_AUTH_KEY_P8 = os.getenv("APNS_AUTH_KEY_P8", "")  # p8 contents or path
-APNS_TOPIC = os.getenv("APNS_TOPIC", "")
-FCM_SERVER_KEY = os.getenv("FCM_SERVER_KEY", "")
+APNS_KEY_ID = _env("APNS_KEY_ID", "")
+APNS_TEAM_ID = _env("APNS_TEAM_ID", "")
+APNS_AUTH_KEY_P8 = _env("APNS_AUTH_KEY_P8", "")  # p8 contents or path
+APNS_TOPIC = _env("APNS_TOPIC", "")
+FCM_SERVER_KEY = _env("FCM_SERVER_KEY", "")
 
 # DarkScore selector set (top-8; index 7 is 'other' client-side)
-DARKSCORE_TOP8_SELECTORS = [
-    s.strip().lower() for s in os.getenv(
-        "DARKSCORE_TOP8_SELECTORS",
-        "0x010ffc9a,0x91d14854,0x637e89c7,0x2e16c2bc,0x7a2b6e7f,0x5f8a1e0a,0x4c6f6972"
-    ).split(",") if s.strip()
-]
+DARKSCORE_TOP8_SELECTORS = _csv(
+    "DARKSCORE_TOP8_SELECTORS",
+    "0x010ffc9a,0x91d14854,0x637e89c7,0x2e16c2bc,0x7a2b6e7f,0x5f8a1e0a,0x4c6f6972",
+    lower=True,
+)
 
 # Billing (Stripe)
-STRIPE_SECRET_KEY = os.getenv("STRIPE_SECRET_KEY", "")
-STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET", "")
-STRIPE_PRICE_PRO_MONTHLY = os.getenv("STRIPE_PRICE_PRO_MONTHLY", "")
-STRIPE_PRICE_INSTITUTIONAL_MONTHLY = os.getenv("STRIPE_PRICE_INSTITUTIONAL_MONTHLY", "")
-STRIPE_PRICE_PRO_ANNUAL = os.getenv("STRIPE_PRICE_PRO_ANNUAL", "")
-STRIPE_PRICE_INSTITUTIONAL_ANNUAL = os.getenv("STRIPE_PRICE_INSTITUTIONAL_ANNUAL", "")
-STRIPE_SUCCESS_URL = os.getenv("STRIPE_SUCCESS_URL", "")
-STRIPE_CANCEL_URL = os.getenv("STRIPE_CANCEL_URL", "")
+STRIPE_SECRET_KEY = _env("STRIPE_SECRET_KEY", "")
+STRIPE_WEBHOOK_SECRET = _env("STRIPE_WEBHOOK_SECRET", "")
+STRIPE_PRICE_PRO_MONTHLY = _env("STRIPE_PRICE_PRO_MONTHLY", "")
+STRIPE_PRICE_INSTITUTIONAL_MONTHLY = _env("STRIPE_PRICE_INSTITUTIONAL_MONTHLY", "")
+STRIPE_PRICE_PRO_ANNUAL = _env("STRIPE_PRICE_PRO_ANNUAL", "")
+STRIPE_PRICE_INSTITUTIONAL_ANNUAL = _env("STRIPE_PRICE_INSTITUTIONAL_ANNUAL", "")
+STRIPE_SUCCESS_URL = _env("STRIPE_SUCCESS_URL", "")
+STRIPE_CANCEL_URL = _env("STRIPE_CANCEL_URL", "")
 
 # Local dev convenience
-LOCAL_LAN_IP = os.getenv("LOCAL_LAN_IP", "")
+LOCAL_LAN_IP = _env("LOCAL_LAN_IP", "")
 
 # Admin portal
-ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "")
+ADMIN_PASSWORD = _env("ADMIN_PASSWORD", "")
 
 # CORS (for cross-domain web clients, e.g., www -> api)
-_CORS_ORIGINS_RAW = [o.strip() for o in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",") if o.strip()]
-CORS_ALLOW_ORIGINS = ["*"] if _CORS_ORIGINS_RAW == ["*"] else _CORS_ORIGINS_RAW
-CORS_ALLOW_CREDENTIALS = os.getenv("CORS_ALLOW_CREDENTIALS", "true").lower() == "true"
-CORS_ALLOW_METHODS = [m.strip().upper() for m in os.getenv("CORS_ALLOW_METHODS", "*").split(",") if m.strip()]
-CORS_ALLOW_HEADERS = [h.strip() for h in os.getenv("CORS_ALLOW_HEADERS", "*").split(",") if h.strip()]
+CORS_ALLOW_ORIGINS = _csv("CORS_ALLOW_ORIGINS", "*")
+CORS_ALLOW_CREDENTIALS = _bool("CORS_ALLOW_CREDENTIALS", True)
+CORS_ALLOW_METHODS = tuple(m.upper() for m in _csv("CORS_ALLOW_METHODS", "*"))
+CORS_ALLOW_HEADERS = _csv("CORS_ALLOW_HEADERS", "*")
 
 # Telegram alerts (Redis -> Telegram worker)
-TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
-TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")
-TELEGRAM_MIN_CONFIDENCE = int(os.getenv("TELEGRAM_MIN_CONFIDENCE", "85"))
+TELEGRAM_BOT_TOKEN = _env("TELEGRAM_BOT_TOKEN", "")
+TELEGRAM_CHAT_ID = _env("TELEGRAM_CHAT_ID", "")
+TELEGRAM_MIN_CONFIDENCE = _int("TELEGRAM_MIN_CONFIDENCE", 85)
@@ -4,6 +4,7 @@ Handles missing Redis and incorrect Yahoo Finance symbols
 """
 
 import os
+from types import MappingProxyType
 
 # Fix Redis URL issues - make Redis optional in production
 REDIS_URL = os.getenv('REDIS_URL', '')
@@ -13,8 +14,8 @@ if not REDIS_URL or REDIS_URL == 'None' or not REDIS_URL.startswith(('redis://',
     os.environ['REDIS_OPTIONAL'] = 'true'
     print("[CONFIG] Redis disabled - running in-memory mode")
 
-# Fix Yahoo Finance symbols - use correct ETF tickers
-YAHOO_SYMBOL_MAP = {
+# Fix Yahoo Finance symbols - use correct ETF tickers (keys are already upper-case)
+YAHOO_SYMBOL_MAP = MappingProxyType({
     # Original -> Correct ticker
     'ES=F': 'SPY',     # Use SPY ETF instead of ES futures
     'NQ=F': 'QQQ',     # Use QQQ ETF instead of NQ futures
@@ -26,8 +27,11 @@ YAHOO_SYMBOL_MAP = {
     'ZB=F': 'TLT',     # Bond futures -> Bond ETF
     'ZN=F': 'IEF',     # 10Y Note futures -> Treasury ETF
     'VIX': '^VIX',     # Keep VIX as is (index)
-}
+})
 
 def fix_yahoo_symbol(symbol: str) -> str:
     """Convert futures/index symbols to ETF equivalents"""
+    fixed = YAHOO_SYMBOL_MAP.get(symbol)
+    if fixed is not None:
+        return fixed
     return YAHOO_SYMBOL_MAP.get(symbol.upper(), symbol)
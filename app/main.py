@@ -1,6 +1,9 @@
 import asyncio
-from fastapi import FastAPI, Response, APIRouter, APIRouter
-from fastapi.responses import RedirectResponse
+import importlib
+import importlib.util
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response, APIRouter
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 from app.config import XRPL_WSS, ALCHEMY_WS_URL, FINNHUB_API_KEY, SOLANA_RPC_URL, APP_VERSION
 from app.config import SENTRY_DSN, APP_ENV
@@ -10,71 +13,69 @@ from app.config import CORS_ALLOW_ORIGINS, CORS_ALLOW_CREDENTIALS, CORS_ALLOW_ME
 from api.sdui import router as sdui_router
 from api.debug import router as debug_router
 from api.health import router as health_router
-from api.ui import router as ui_router
+from api.ui import router as ui_router, shutdown as ui_shutdown
 from api.billing import router as billing_router
 from api.admin import router as admin_router
 from api.db_health import router as db_health_router
 from api.scanner_health import router as scanner_health_router
 from api.dashboard import router as dashboard_router
-from api.wallets import router as wallets_router
+from api.wallets import router as wallets_router, shutdown as wallets_shutdown
 from api.flows import router as flows_router
 from api.analytics import router as analytics_router
 from api.correlations import router as correlations_router
 from api.latency import router as latency_router
-from api.tuned_analytics import router as tuned_analytics_router
+from api.tuned_analytics import (
+    router as tuned_analytics_router,
+    startup as tuned_analytics_startup,
+    shutdown as tuned_analytics_shutdown,
+)
 from api.monitoring import router as monitoring_router
+from api.wallet_analysis import router as wallet_analysis_router
 from fastapi.staticfiles import StaticFiles
-from observability.impact import start_binance_depth_worker
 from api.export import router as export_router
 from middleware.api_key import api_key_middleware
-from scanners.solana_humidifi import start_solana_humidifi_worker
 from api.onchain import router as onchain_router
-from billing.onchain_watchers import start_solana_onchain_watcher, start_eth_onchain_watcher, start_onchain_maintenance
 from api.notify import router as notify_router
-from notifications.push_worker import start_push_worker
-from notifications.telegram_worker import start_telegram_worker
 from api.history import router as history_router
 from api.qr import router as qr_router
 from api.user import router as user_router
 from fastapi.middleware.cors import CORSMiddleware
-import sentry_sdk
-from sentry_sdk.integrations.starlette import StarletteIntegration
-from predictors.futures_tracker import start_binance_futures_tracker
-from predictors.polygon_macro_tracker import start_polygon_macro_tracker
-try:
-    from predictors.databento_macro_tracker import start_databento_macro_tracker
-except Exception:
-    async def start_databento_macro_tracker(symbols=None):
-        return
-try:
-    from predictors.alpha_macro_tracker import start_alpha_macro_tracker
-except Exception:
-    async def start_alpha_macro_tracker(symbols=None):
-        return
-try:
-    from predictors.yahoo_macro_tracker import start_yahoo_macro_tracker
-except Exception:
-    async def start_yahoo_macro_tracker(symbols=None):
-        return
-from scanners.zk_scanner import start_zk_scanner
-from scanners.xrpl_scanner import start_xrpl_scanner
-from scanners.xrpl_trustline_watcher import start_trustline_watcher
-from scanners.xrpl_orderbook_monitor import start_xrpl_orderbook_monitor
-from scanners.futures_scanner import start_futures_scanner
-from scanners.forex_scanner import start_forex_scanner
-from scanners.nansen_scanner import start_nansen_scanner
-from scanners.dune_scanner import start_dune_scanner
-from scanners.whale_alert_scanner import run_whale_alert_scanner
+from utils.responses import ORJSONResponse, dumps_json
 from observability.metrics import (
-    zk_dominant_frequency_hz,
     zk_frequency_confidence,
     zk_flow_confidence_score,
 )
 
+
+def _optional_worker(module: str, attr: str):
+    """Resolve an optional worker entry point, or None if its module is missing or fails to import."""
+    # find_spec is a finder lookup, so a missing module costs no ImportError
+    if importlib.util.find_spec(module) is None:
+        return None
+    try:
+        return getattr(importlib.import_module(module), attr)
+    except Exception:
+        return None
+
+
+# Macro (ES/NQ) tracker, chosen once from config: Polygon first (more reliable for ETF data),
+# then Yahoo Finance unless equity fallbacks are disabled, then Databento
+if POLYGON_API_KEY:
+    _MACRO_TRACKER = ("Polygon macro tracker", "predictors.polygon_macro_tracker", "start_polygon_macro_tracker")
+elif not DISABLE_EQUITY_FALLBACK:
+    _MACRO_TRACKER = ("Yahoo Finance macro tracker", "predictors.yahoo_macro_tracker", "start_yahoo_macro_tracker")
+elif DATABENTO_API_KEY:
+    _MACRO_TRACKER = ("Databento macro tracker", "predictors.databento_macro_tracker", "start_databento_macro_tracker")
+else:
+    _MACRO_TRACKER = None
+
 if SENTRY_DSN:
     try:
         _dsn = str(SENTRY_DSN).strip()
         if _dsn and _dsn.lower().startswith("http"):
+            # Imported only when configured; sentry_sdk pulls in dozens of submodules
+            import sentry_sdk
+            from sentry_sdk.integrations.starlette import StarletteIntegration
             sentry_sdk.init(
                 dsn=_dsn,
                 environment=APP_ENV,
@@ -86,11 +87,25 @@ if SENTRY_DSN:
     except Exception:
         pass
 
-app = FastAPI()
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Router modules expose plain startup/shutdown hooks instead of
+    # router.on_event: every router is included twice (/api and /), which
+    # would register and run each on_event hook twice
+    await tuned_analytics_startup()
+    await _startup()
+    yield
+    await ui_shutdown()
+    await wallets_shutdown()
+    await tuned_analytics_shutdown()
+    await _shutdown()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=_lifespan)
 
 # Fix CORS for production - if no specific origins are set, use default production domains
 cors_origins = CORS_ALLOW_ORIGINS
-if not cors_origins or cors_origins == ["*"]:
+if not cors_origins or cors_origins == ("*",):
     # Default to our production domains if CORS_ALLOW_ORIGINS is not properly set
     cors_origins = [
         "https://zkalphaflow-q3alj.ondigitalocean.app",
@@ -107,72 +122,85 @@ app.add_middleware(
     allow_methods=CORS_ALLOW_METHODS or ["*"],
     allow_headers=CORS_ALLOW_HEADERS or ["*"],
 )
+# Routers in registration order. Route matching is a linear scan, so the
+# high-traffic routers (health probes, dashboard/UI polling) come first.
+# correlations must stay ahead of tuned_analytics: both define
+# GET /analytics/correlations and the first registered wins.
+_ROUTERS = (
+    health_router,
+    dashboard_router,
+    ui_router,
+    sdui_router,
+    flows_router,
+    wallets_router,
+    scanner_health_router,
+    db_health_router,
+    monitoring_router,
+    analytics_router,
+    correlations_router,
+    tuned_analytics_router,
+    latency_router,
+    history_router,
+    onchain_router,
+    notify_router,
+    user_router,
+    billing_router,
+    export_router,
+    qr_router,
+    admin_router,
+    debug_router,
+)
+
 # Mount all API routes under /api prefix for DigitalOcean routing
 api_router = APIRouter()
-api_router.include_router(ui_router)
-api_router.include_router(sdui_router)
-api_router.include_router(billing_router)
-api_router.include_router(admin_router)
-api_router.include_router(export_router)
-api_router.include_router(onchain_router)
-api_router.include_router(notify_router)
-api_router.include_router(history_router)
-api_router.include_router(qr_router)
-api_router.include_router(user_router)
-api_router.include_router(debug_router)
-api_router.include_router(health_router)
-api_router.include_router(db_health_router)
-api_router.include_router(scanner_health_router)
-api_router.include_router(dashboard_router)
-api_router.include_router(wallets_router)
-api_router.include_router(flows_router)
-api_router.include_router(analytics_router)
-api_router.include_router(correlations_router)
-api_router.include_router(latency_router)
-api_router.include_router(tuned_analytics_router)
-api_router.include_router(monitoring_router)
+for _router in _ROUTERS:
+    api_router.include_router(_router)
 
 app.include_router(api_router, prefix="/api")
 
 # Also mount at root level for direct API access
-app.include_router(ui_router)
-app.include_router(sdui_router)
-app.include_router(billing_router)
-app.include_router(admin_router)
-app.include_router(export_router)
-app.include_router(onchain_router)
-app.include_router(notify_router)
-app.include_router(history_router)
-app.include_router(qr_router)
-app.include_router(user_router)
-app.include_router(debug_router)
-app.include_router(health_router)
-app.include_router(db_health_router)
-app.include_router(scanner_health_router)
-app.include_router(dashboard_router)
-app.include_router(wallets_router)
-app.include_router(flows_router)
-app.include_router(analytics_router)
-app.include_router(correlations_router)
-app.include_router(latency_router)
-app.include_router(tuned_analytics_router)
-app.include_router(monitoring_router)
+for _router in _ROUTERS:
+    app.include_router(_router)
 
 # Wallet analysis for institutional tracking
-from api.wallet_analysis import router as wallet_analysis_router
 app.include_router(wallet_analysis_router)
 app.mount("/static", StaticFiles(directory="clients"), name="static")
 app.middleware("http")(api_key_middleware)
 
+# The redirect target is fixed, so skip RedirectResponse's per-request URL quoting.
+# A fresh Response is still built per request: Response sends its raw_headers list by
+# reference and CORSMiddleware appends to it, so a shared instance would accumulate headers.
+_ROOT_REDIRECT_HEADERS = {"location": "/ui"}
+
+
 @app.get("/", include_in_schema=False)
 async def root_redirect():
-    return RedirectResponse(url="/ui")
+    return Response(status_code=307, headers=_ROOT_REDIRECT_HEADERS)
 
 @app.head("/", include_in_schema=False)
 async def root_redirect_head():
-    return RedirectResponse(url="/ui")
+    return Response(status_code=307, headers=_ROOT_REDIRECT_HEADERS)
+
+# Optional workers: (label, module, entry point). Their imports pull in xgboost/slack clients.
+_OPTIONAL_WORKERS = (
+    ("Latency pinger worker", "predictors.latency_pinger", "start_latency_pinger_worker"),
+    ("XGBoost latency predictor", "ml.latency_xgboost", "start_latency_prediction_worker"),
+    ("Slack latency bot", "workers.slack_latency_bot", "start_slack_latency_bot"),
+    ("Educator bot", "workers.educator_bot", "start_educator_bot"),
+)
+
+
+async def _start_optional_workers():
+    """Import optional workers off the event loop and launch each once loaded."""
+    for label, module, entry in _OPTIONAL_WORKERS:
+        try:
+            mod = await asyncio.to_thread(importlib.import_module, module)
+            asyncio.create_task(getattr(mod, entry)())
+            print(f"[STARTUP] {label} started")
+        except Exception as e:
+            print(f"[STARTUP] {label} skipped: {e}")
+
 
-@app.on_event("startup")
 async def _startup():
     # Initialize database schema for signal tracking
     try:
@@ -190,115 +218,69 @@ async def _startup():
     except Exception as e:
         print(f"[STARTUP] Outcome checker skipped: {e}")
     
-    # Launch Binance depth worker (non-blocking)
-    asyncio.create_task(start_binance_depth_worker())
-    if SOLANA_RPC_URL:
-        asyncio.create_task(start_solana_humidifi_worker())
-        asyncio.create_task(start_solana_onchain_watcher())
-    asyncio.create_task(start_eth_onchain_watcher())
-    asyncio.create_task(start_push_worker())
-    asyncio.create_task(start_onchain_maintenance())
-    if ALCHEMY_WS_URL:
-        asyncio.create_task(start_zk_scanner())
-    # XRPL scanners for XRP flows, trustlines, and orderbook
+    # (enabled, module, entry point) for each non-blocking background task.
+    # Background workers pull in the scanner/predictor dependency trees, so only
+    # the enabled ones are imported, and only here (keeps import and --reload fast)
+    worker_specs = (
+        (True, "observability.impact", "start_binance_depth_worker"),
+        (bool(SOLANA_RPC_URL), "scanners.solana_humidifi", "start_solana_humidifi_worker"),
+        (bool(SOLANA_RPC_URL), "billing.onchain_watchers", "start_solana_onchain_watcher"),
+        (True, "billing.onchain_watchers", "start_eth_onchain_watcher"),
+        (True, "notifications.push_worker", "start_push_worker"),
+        (True, "billing.onchain_watchers", "start_onchain_maintenance"),
+        (bool(ALCHEMY_WS_URL), "scanners.zk_scanner", "start_zk_scanner"),
+        # XRPL scanners for XRP flows, trustlines, and orderbook
+        (bool(XRPL_WSS), "scanners.xrpl_scanner", "start_xrpl_scanner"),
+        (bool(XRPL_WSS), "scanners.xrpl_trustline_watcher", "start_trustline_watcher"),
+        (bool(XRPL_WSS), "scanners.xrpl_orderbook_monitor", "start_xrpl_orderbook_monitor"),
+        (True, "predictors.futures_tracker", "start_binance_futures_tracker"),
+        # Multi-asset scanners for cross-market correlation
+        (True, "scanners.futures_scanner", "start_futures_scanner"),          # Databento: ES, NQ, VIX, Gold, Oil
+        (True, "scanners.forex_scanner", "start_forex_scanner"),              # Alpha Vantage: EUR/USD, DXY proxy, news
+        (True, "scanners.nansen_scanner", "start_nansen_scanner"),            # Nansen: Whale labels, smart money
+        (True, "scanners.dune_scanner", "start_dune_scanner"),                # Dune: DEX volume, stablecoin flows
+        (True, "scanners.whale_alert_scanner", "run_whale_alert_scanner"),    # Whale Alert: Large transfers, confidence
+        (True, "notifications.telegram_worker", "start_telegram_worker"),     # Telegram dark-flow alerts (optional)
+    )
+    workers = [
+        getattr(importlib.import_module(module), entry)
+        for enabled, module, entry in worker_specs
+        if enabled
+    ]
+    for worker in workers:
+        asyncio.create_task(worker())
+    
+    # Start ledger drift monitor
     if XRPL_WSS:
-        asyncio.create_task(start_xrpl_scanner())
-        asyncio.create_task(start_trustline_watcher())
-        asyncio.create_task(start_xrpl_orderbook_monitor())
-        # Start ledger drift monitor
         try:
             from workers.ledger_monitor import start_ledger_monitor
             await start_ledger_monitor()
             print("[STARTUP] Ledger drift monitor started")
         except Exception as e:
             print(f"[STARTUP] Ledger monitor skipped: {e}")
-    asyncio.create_task(start_binance_futures_tracker())
     
-    # Multi-asset scanners for cross-market correlation
-    asyncio.create_task(start_futures_scanner())   # Databento: ES, NQ, VIX, Gold, Oil
-    asyncio.create_task(start_forex_scanner())     # Alpha Vantage: EUR/USD, DXY proxy, news
-    asyncio.create_task(start_nansen_scanner())    # Nansen: Whale labels, smart money
-    asyncio.create_task(start_dune_scanner())      # Dune: DEX volume, stablecoin flows
-    asyncio.create_task(run_whale_alert_scanner()) # Whale Alert: Large transfers, confidence
+    # Optional ML/bot workers load in the background so startup doesn't wait on their imports
+    asyncio.create_task(_start_optional_workers())
     
-    # Latency pinger for algo tracking
-    try:
-        from predictors.latency_pinger import start_latency_pinger_worker
-        asyncio.create_task(start_latency_pinger_worker())
-        print("[STARTUP] Latency pinger worker started")
-    except Exception as e:
-        print(f"[STARTUP] Latency pinger skipped: {e}")
-    
-    # XGBoost latency prediction model
-    try:
-        from ml.latency_xgboost import start_latency_prediction_worker
-        asyncio.create_task(start_latency_prediction_worker())
-        print("[STARTUP] XGBoost latency predictor started")
-    except Exception as e:
-        print(f"[STARTUP] XGBoost predictor skipped: {e}")
-    
-    # Slack latency bot for anomaly alerts
-    try:
-        from workers.slack_latency_bot import start_slack_latency_bot
-        asyncio.create_task(start_slack_latency_bot())
-        print("[STARTUP] Slack latency bot started")
-    except Exception as e:
-        print(f"[STARTUP] Slack latency bot skipped: {e}")
-    
-    # Educator bot for futures trading courses
-    try:
-        from workers.educator_bot import start_educator_bot
-        asyncio.create_task(start_educator_bot())
-        print("[STARTUP] Educator bot started")
-    except Exception as e:
-        print(f"[STARTUP] Educator bot skipped: {e}")
-    
-    # Try Polygon first (more reliable for ETF data)
     macro_started = False
-    if POLYGON_API_KEY:
-        try:
-            asyncio.create_task(start_polygon_macro_tracker())
-            print("[STARTUP] Polygon macro tracker started for ES/NQ data")
-            macro_started = True
-        except Exception as e:
-            print(f"[STARTUP] Polygon macro tracker failed: {e}")
-
-    # Fallback to Yahoo if Polygon not available
-    if not macro_started:
-        try:
-            asyncio.create_task(start_yahoo_macro_tracker())
-            print("[STARTUP] Yahoo Finance macro tracker started (fallback)")
-            macro_started = True
-        except Exception as e:
-            print(f"[STARTUP] Yahoo macro tracker failed: {e}")
-
-    # Final fallback to Databento
-    if not macro_started and DATABENTO_API_KEY:
-        try:
-            asyncio.create_task(start_databento_macro_tracker())
-            print("[STARTUP] Databento macro tracker started (final fallback)")
+    if _MACRO_TRACKER:
+        label, module, entry = _MACRO_TRACKER
+        tracker = _optional_worker(module, entry)
+        if tracker is not None:
+            asyncio.create_task(tracker())
+            print(f"[STARTUP] {label} started")
             macro_started = True
-        except Exception as e:
-            print(f"[STARTUP] Databento macro tracker failed: {e}")
-
+        else:
+            print(f"[STARTUP] {label} unavailable")
     if not macro_started:
         print("[STARTUP] WARNING: No macro tracker could be started - futures flow will remain idle")
     try:
-        zk_dominant_frequency_hz.labels(source="futures_btcusdt").set(0.0)
-        zk_dominant_frequency_hz.labels(source="futures_ethusdt").set(0.0)
-        zk_dominant_frequency_hz.labels(source="zk_events").set(0.0)
-        zk_dominant_frequency_hz.labels(source="xrpl_settlements").set(0.0)
-        zk_dominant_frequency_hz.labels(source="macro_es").set(0.0)
-        zk_dominant_frequency_hz.labels(source="macro_nq").set(0.0)
         zk_frequency_confidence.labels(algo_fingerprint="unknown").set(0.0)
         zk_flow_confidence_score.labels(protocol="godark").set(0.0)
     except Exception:
         pass
-    # Telegram dark-flow alerts (optional)
-    asyncio.create_task(start_telegram_worker())
 
 
-@app.on_event("shutdown")
 async def _shutdown():
     """Graceful shutdown - close database connections."""
     print("[SHUTDOWN] Closing database connections...")
@@ -310,22 +292,58 @@ async def _shutdown():
     print("[SHUTDOWN] Complete")
 
 
+# /health only reflects env config, so the payload is built and encoded once
+_HEALTH = {
+    "status": "live",
+    "chains": [c for c, url in (("xrpl", XRPL_WSS), ("ethereum", ALCHEMY_WS_URL), ("solana", SOLANA_RPC_URL)) if url],
+    "scanner": "humidifi_proxy_active" if SOLANA_RPC_URL else "",
+    "version": APP_VERSION,
+    "equities": bool(FINNHUB_API_KEY),
+}
+_HEALTH_BODY = dumps_json(_HEALTH)
+
+
 @app.get("/health")
 async def health():
-    chains = []
-    if XRPL_WSS:
-        chains.append("xrpl")
-    if ALCHEMY_WS_URL:
-        chains.append("ethereum")
-    if SOLANA_RPC_URL:
-        chains.append("solana")
-    equities = bool(FINNHUB_API_KEY)
-    scanner = "humidifi_proxy_active" if SOLANA_RPC_URL else ""
-    status = "live"
-    return {"status": status, "chains": chains, "scanner": scanner, "version": APP_VERSION, "equities": equities}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+# Scrapes within the TTL share one encoded snapshot; encoding runs off the event loop
+_METRICS_TTL_SECONDS = 0.5
+_metrics_cache = (0.0, b"")  # (monotonic timestamp, encoded snapshot), swapped as a unit
+_metrics_lock = asyncio.Lock()
+
 
 @app.get("/metrics")
 async def metrics():
-    data = generate_latest()
-    return Response(content=data, media_type=CONTENT_TYPE_LATEST)
+    global _metrics_cache
+    ts, buf = _metrics_cache
+    if time.monotonic() - ts > _METRICS_TTL_SECONDS:
+        async with _metrics_lock:
+            # Re-check: a concurrent scrape may have refreshed while we waited
+            ts, buf = _metrics_cache
+            if time.monotonic() - ts > _METRICS_TTL_SECONDS:
+                buf = await asyncio.to_thread(generate_latest)
+                _metrics_cache = (time.monotonic(), buf)
+    return Response(content=buf, media_type=CONTENT_TYPE_LATEST)
 # Force complete restart
+
+
+def _check_registration() -> None:
+    """One-shot guard against double registration, e.g. a router included twice under one prefix."""
+    seen = set()
+    for route in app.routes:
+        key = (
+            getattr(route, "path", None),
+            frozenset(getattr(route, "methods", None) or ()),
+            getattr(route, "endpoint", None),
+        )
+        if key in seen:
+            raise RuntimeError(f"Route registered twice: {sorted(key[1])} {key[0]}")
+        seen.add(key)
+    # _lifespan replaces Starlette's hook runner, and on_event hooks from routers
+    # in _ROUTERS would be collected once per mount anyway
+    if app.router.on_startup or app.router.on_shutdown:
+        raise RuntimeError("on_event hooks are not run by _lifespan; call them from _lifespan instead")
+
+
+_check_registration()
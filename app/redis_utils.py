@@ -53,12 +53,41 @@ class FakeRedis:
         pass
     
     def pubsub(self):
-        """Return a fake pubsub object"""
-        return FakePubSub()
+        """Return the shared fake pubsub object"""
+        return _FAKE_PUBSUB
+
+    def pipeline(self, transaction: bool = True):
+        """Return a fake pipeline that replays queued calls on this client"""
+        return FakePipeline(self)
     
     async def close(self):
         pass
 
+class FakePipeline:
+    """Fake pipeline: queues commands and runs them against FakeRedis on execute"""
+
+    def __init__(self, client: FakeRedis):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._calls.append((method, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        calls, self._calls = self._calls, []
+        return [await m(*a, **kw) for m, a, kw in calls]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self._calls = []
+
 class FakePubSub:
     """Fake PubSub client"""
     
@@ -79,17 +108,24 @@ class FakePubSub:
     async def close(self):
         pass
 
+# FakeRedis/FakePubSub are stateless no-ops, so one instance each is shared
+_FAKE_REDIS = FakeRedis()
+_FAKE_PUBSUB = FakePubSub()
+
 _redis_client = None  # Redis client instance
+_disabled_warned = False
 
 async def get_redis():
     """
     Get Redis client with graceful fallback to FakeRedis if Redis is not available
     """
-    global _redis_client
+    global _redis_client, _disabled_warned
     
     if not REDIS_ENABLED:
-        print("[Redis] Redis is disabled, using in-memory fallback")
-        return FakeRedis()
+        if not _disabled_warned:
+            _disabled_warned = True
+            print("[Redis] Redis is disabled, using in-memory fallback")
+        return _FAKE_REDIS
     
     if _redis_client is None:
         try:
@@ -100,7 +136,7 @@ async def get_redis():
         except Exception as e:
             print(f"[Redis] Failed to connect to Redis: {e}")
             print("[Redis] Falling back to in-memory mode")
-            return FakeRedis()
+            return _FAKE_REDIS
     
     return _redis_client
 
@@ -13,6 +13,9 @@ from predictors.xrp_iso_predictor import enrich_iso_signal
 
 _redis_warned: bool = False  # Only warn once about Redis connection issues
 
+# Pub/sub channel announcing each signal written to the streams (SSE/WS push)
+SIGNALS_CHANNEL = "signals:new"
+
 
 async def _get_redis():
     """Get Redis connection with fallback to None if disabled."""
@@ -121,6 +124,10 @@ async def publish_signal(signal: Dict[str, Any]) -> None:
             await r.xadd("signals", {"json": data}, maxlen=5000, approximate=True)
         except Exception as e:
             _redis_error("xadd", e)
+        try:
+            await r.publish(SIGNALS_CHANNEL, data)
+        except Exception as e:
+            _redis_error("publish", e)
     
     # Store signal to database for analytics tracking
     try:
@@ -141,7 +148,17 @@ async def publish_signal(signal: Dict[str, Any]) -> None:
         print(f"[SlackAlert] Failed: {e}")
 
 
-async def fetch_recent_signals(window_seconds: int = 900, types: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+async def fetch_recent_signals(
+    window_seconds: int = 900,
+    types: Optional[List[str]] = None,
+    stream_ms: bool = False,
+) -> List[Dict[str, Any]]:
+    """Signals added to the stream in the last window_seconds.
+
+    With stream_ms=True each signal carries "_stream_ms", its stream entry time
+    (insertion time in ms); a signal's own "timestamp" may be missing or be the
+    on-chain time, so windowing on it can drop fresh entries.
+    """
     r = await _get_redis()
     if not r:
         return []  # Redis not available
@@ -154,7 +171,7 @@ async def fetch_recent_signals(window_seconds: int = 900, types: Optional[List[s
         _redis_error("xrange", e)
         rows = []
     out: List[Dict[str, Any]] = []
-    for _, fields in rows:
+    for entry_id, fields in rows:
         raw = fields.get("json")
         if not raw:
             continue
@@ -164,6 +181,11 @@ async def fetch_recent_signals(window_seconds: int = 900, types: Optional[List[s
             continue
         if types and s.get("type") not in types:
             continue
+        if stream_ms:
+            try:
+                s["_stream_ms"] = int(str(entry_id).split("-", 1)[0])
+            except ValueError:
+                s["_stream_ms"] = 0
         out.append(s)
     return out
 
@@ -180,6 +202,10 @@ async def publish_cross_signal(cross: Dict[str, Any]) -> None:
         await r.xadd("cross_signals", {"json": data}, maxlen=1000, approximate=True)
     except Exception as e:
         _redis_error("xadd_cross", e)
+    try:
+        await r.publish(SIGNALS_CHANNEL, data)
+    except Exception as e:
+        _redis_error("publish_cross", e)
 
 
 async def fetch_recent_cross_signals(limit: int = 10) -> List[Dict[str, Any]]:
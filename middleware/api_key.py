@@ -2,10 +2,13 @@ import time
 from typing import Optional, Dict, Any
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from app.redis_utils import get_redis, REDIS_ENABLED
 
+# Constant 429 body, encoded once rather than through json.dumps per rejection
+_RATE_LIMITED_BODY = b'{"detail":"rate limit exceeded"}'
+
 
 async def _r():
     return await get_redis()
@@ -49,7 +52,7 @@ async def api_key_middleware(request: Request, call_next):
             if cnt == 1:
                 await r.expire(key, 1)
             if cnt > 10:
-                return JSONResponse({"detail": "rate limit exceeded"}, status_code=429)
+                return Response(content=_RATE_LIMITED_BODY, status_code=429, media_type="application/json")
         except Exception:
             pass
 
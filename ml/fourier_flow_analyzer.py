@@ -7,7 +7,7 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 from scipy import signal
-from scipy.fft import fft, fftfreq, ifft
+from scipy.fft import fft, fftfreq, ifft, rfft, rfftfreq
 from scipy.signal import welch, find_peaks
 import logging
 
@@ -45,25 +45,9 @@ class FourierFlowAnalyzer:
         """
         Extract frequency domain features using optimized FFT
         """
-        features = {}
-        
-        # Apply Hann window to reduce spectral leakage
-        window = signal.windows.hann(len(data))
-        windowed_data = data * window
-        
-        # Compute FFT
-        fft_values = fft(windowed_data)
-        frequencies = fftfreq(len(data), 1/self.sampling_rate)
-        
-        # Get positive frequencies only
-        positive_freq_idx = frequencies > 0
-        frequencies = frequencies[positive_freq_idx]
-        fft_magnitude = np.abs(fft_values[positive_freq_idx])
-        
-        # Extract power spectral density
-        features['frequencies'] = frequencies
-        features['magnitude'] = fft_magnitude
-        features['phase'] = np.angle(fft_values[positive_freq_idx])
+        features = self.compute_spectrum(data)
+        frequencies = features['frequencies']
+        fft_magnitude = features['magnitude']
         
         # Power spectral density using Welch's method
         freqs_welch, psd = welch(
@@ -91,6 +75,26 @@ class FourierFlowAnalyzer:
         
         return features
     
+    def compute_spectrum(self, data: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Hann-windowed spectrum (positive frequencies only)
+        Computed once per series so pairwise correlations can reuse it
+        """
+        n = len(data)
+        
+        # Apply Hann window to reduce spectral leakage
+        windowed_data = data * signal.windows.hann(n)
+        
+        # Real FFT; keep strictly positive bins below Nyquist
+        positive = slice(1, (n + 1) // 2)
+        fft_values = rfft(windowed_data)[positive]
+        
+        return {
+            'frequencies': rfftfreq(n, 1/self.sampling_rate)[positive],
+            'magnitude': np.abs(fft_values),
+            'phase': np.angle(fft_values)
+        }
+    
     def detect_harmonic_patterns(self, 
                                   data: np.ndarray,
                                   fundamental_freq: Optional[float] = None) -> Dict:
@@ -164,17 +168,24 @@ class FourierFlowAnalyzer:
         Calculate frequency-domain correlation between assets
         Critical for detecting ETH/BTC manipulation affecting XRP
         """
-        # Extract frequency features for both assets
-        features1 = self.extract_frequency_features(asset1_data)
-        features2 = self.extract_frequency_features(asset2_data)
-        
+        return self.correlate_from_spectra(
+            self.compute_spectrum(asset1_data),
+            self.compute_spectrum(asset2_data)
+        )
+    
+    def correlate_from_spectra(self,
+                               spectrum1: Dict[str, np.ndarray],
+                               spectrum2: Dict[str, np.ndarray]) -> Dict:
+        """
+        Frequency-domain correlation from precomputed spectra (see compute_spectrum)
+        """
         # Ensure same frequency bins
-        min_len = min(len(features1['magnitude']), len(features2['magnitude']))
-        mag1 = features1['magnitude'][:min_len]
-        mag2 = features2['magnitude'][:min_len]
-        phase1 = features1['phase'][:min_len]
-        phase2 = features2['phase'][:min_len]
-        freqs = features1['frequencies'][:min_len]
+        min_len = min(len(spectrum1['magnitude']), len(spectrum2['magnitude']))
+        mag1 = spectrum1['magnitude'][:min_len]
+        mag2 = spectrum2['magnitude'][:min_len]
+        phase1 = spectrum1['phase'][:min_len]
+        phase2 = spectrum2['phase'][:min_len]
+        freqs = spectrum1['frequencies'][:min_len]
         
         # Magnitude correlation
         mag_correlation = np.corrcoef(mag1, mag2)[0, 1]
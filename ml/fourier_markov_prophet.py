@@ -541,3 +541,30 @@ class FourierMarkovProphetIntegrator:
         logger.info(f"Meta-learner trained with accuracy: {accuracy:.2%}")
         
         return accuracy
+
+
+# One warm integrator per worker process (Prophet/sklearn state is not shared across processes)
+_process_integrator: Optional[FourierMarkovProphetIntegrator] = None
+
+
+def predict_multi_asset_flows_sync(xrp_data: pd.DataFrame,
+                                   btc_data: pd.DataFrame,
+                                   eth_data: pd.DataFrame,
+                                   spy_data: pd.DataFrame,
+                                   gold_data: Optional[pd.DataFrame] = None,
+                                   forecast_horizon: int = 24) -> Dict:
+    """
+    Synchronous entry point for running the integrated prediction in an executor process
+    """
+    global _process_integrator
+    if _process_integrator is None:
+        _process_integrator = FourierMarkovProphetIntegrator()
+    
+    return asyncio.run(_process_integrator.predict_multi_asset_flows(
+        xrp_data=xrp_data,
+        btc_data=btc_data,
+        eth_data=eth_data,
+        spy_data=spy_data,
+        gold_data=gold_data,
+        forecast_horizon=forecast_horizon
+    ))
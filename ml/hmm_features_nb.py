@@ -0,0 +1,98 @@
+"""
+Fused HMM feature kernel
+Builds [volume ratio, return, rolling volatility] in a single pass
+"""
+
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("Numba not available - using numpy HMM feature path")
+
+
+def _build_features_np(volume: np.ndarray, close: np.ndarray, roll: int = 20) -> np.ndarray:
+    """
+    Numpy fallback with the same semantics as the pandas pipeline:
+    volume / mean, pct_change().fillna(0), pct_change().rolling(roll).std().fillna(0)
+    """
+    n = close.shape[0]
+    out = np.zeros((n, 3), dtype=np.float64)
+    if n == 0:
+        return out
+
+    out[:, 0] = volume / volume.mean()
+    if n > 1:
+        out[1:, 1] = close[1:] / close[:-1] - 1.0
+    if n > roll:
+        windows = np.lib.stride_tricks.sliding_window_view(out[1:, 1], roll)
+        out[roll:, 2] = windows.std(axis=1, ddof=1)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _build_features_nb(volume, close, roll=20):
+        n = close.shape[0]
+        out = np.zeros((n, 3), dtype=np.float64)
+        if n == 0:
+            return out
+
+        vol_sum = 0.0
+        for i in range(n):
+            vol_sum += volume[i]
+        vol_mean = vol_sum / n
+
+        # Sliding-window Welford over returns; the first return is undefined
+        # (NaN in pandas), so a full window only exists from index `roll` on.
+        mean = 0.0
+        m2 = 0.0
+        count = 0
+        out[0, 0] = volume[0] / vol_mean
+        for i in range(1, n):
+            out[i, 0] = volume[i] / vol_mean
+            ret = close[i] / close[i - 1] - 1.0
+            out[i, 1] = ret
+
+            if count == roll:
+                old = out[i - roll, 1]
+                count -= 1
+                delta = old - mean
+                mean -= delta / count
+                m2 -= delta * (old - mean)
+
+            count += 1
+            delta = ret - mean
+            mean += delta / count
+            m2 += delta * (ret - mean)
+
+            if count == roll and roll > 1:
+                var = m2 / (roll - 1)
+                out[i, 2] = np.sqrt(var) if var > 0.0 else 0.0
+        return out
+
+
+def build_features(volume: np.ndarray, close: np.ndarray, roll: int = 20) -> np.ndarray:
+    """
+    Build the (n, 3) HMM feature matrix from raw volume and close arrays
+    Columns: volume / mean volume, simple return, rolling return volatility
+    """
+    volume = np.ascontiguousarray(volume, dtype=np.float64)
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _build_features_nb(volume, close, roll)
+    return _build_features_np(volume, close, roll)
+
+
+def warmup() -> None:
+    """
+    Compile (or load from the on-disk cache) the feature kernel with representative
+    shapes so the first request doesn't pay JIT latency
+    """
+    if NUMBA_AVAILABLE:
+        build_features(np.ones(128), np.linspace(1.0, 2.0, 128))
@@ -49,6 +49,10 @@ class DarkFlowHMM:
         self.order = 2  # Second-order Markov chain
         self.history_weights = [0.6, 0.4]  # Weight recent history more
         
+        # Greedy next-state lookup, rebuilt when the transition matrix changes
+        self._next_state_table = None
+        self._next_state_source = None
+        
     def _init_transition_matrix(self) -> np.ndarray:
         """
         Initialize transition matrix with XRPL migration bias
@@ -180,6 +184,47 @@ class DarkFlowHMM:
             for i in range(self.n_states)
         }
     
+    def forecast_states(self, current_state: int, history: Optional[List[int]], horizon: int) -> List[int]:
+        """
+        Most likely state path over the horizon (argmax of predict_next_state at each step)
+        Uses a precomputed (previous, current) -> next table instead of per-step dicts
+        """
+        path = []
+        history = list(history or [])
+        if horizon <= 0:
+            return path
+        
+        if self.order != 2 or len(self.history_weights) < 2:
+            for _ in range(horizon):
+                next_probs = self.predict_next_state(current_state, history)
+                current_state = self.state_names.index(max(next_probs, key=next_probs.get))
+                history.append(current_state)
+                path.append(current_state)
+            return path
+        
+        if len(history) < self.order:
+            # First step falls back to the first-order transition
+            current_state = int(np.argmax(self.transition_matrix[current_state]))
+            history.append(current_state)
+            path.append(current_state)
+        
+        table = self._get_next_state_table()
+        prev, curr = int(history[-2]), int(history[-1])
+        for _ in range(horizon - len(path)):
+            prev, curr = curr, int(table[prev, curr])
+            path.append(curr)
+        return path
+    
+    def _get_next_state_table(self) -> np.ndarray:
+        """Argmax of the weighted second-order transition for every state pair"""
+        if self._next_state_source is not self.transition_matrix:
+            w_prev, w_curr = self.history_weights[0], self.history_weights[1]
+            trans = self.transition_matrix
+            combined = w_prev * trans[:, None, :] + w_curr * trans[None, :, :]
+            self._next_state_table = np.argmax(combined, axis=2)
+            self._next_state_source = trans
+        return self._next_state_table
+    
     def detect_manipulation_to_migration(self, states: List[int], window: int = 10) -> List[Dict]:
         """
         Detect patterns indicating manipulation leading to XRPL migration
@@ -73,6 +73,13 @@ zk_dominant_frequency_hz = Gauge(
     ["source"],
 )
 
+# Resolved children for the fixed frequency sources (exported at 0.0 from import);
+# .labels() hashes the label values under a lock on every call
+ZK_FREQ = {
+    s: zk_dominant_frequency_hz.labels(source=s)
+    for s in ("futures_btcusdt", "futures_ethusdt", "zk_events", "xrpl_settlements", "macro_es", "macro_nq")
+}
+
 zk_frequency_confidence = Gauge(
     "zk_frequency_confidence",
     "Confidence (0-100) of dominant frequency matching a known algo fingerprint",
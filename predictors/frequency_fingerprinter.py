@@ -5,6 +5,7 @@ from typing import Dict, Tuple, Optional, Union
 import numpy as np
 
 from observability.metrics import (
+    ZK_FREQ,
     zk_dominant_frequency_hz,
     zk_frequency_confidence,
 )
@@ -119,7 +120,8 @@ class FrequencyFingerprinter:
         self._last_compute_ts = now
         freq, power, fp, conf = self._compute()
         try:
-            zk_dominant_frequency_hz.labels(source=source_label).set(float(freq))
+            gauge = ZK_FREQ.get(source_label) or zk_dominant_frequency_hz.labels(source=source_label)
+            gauge.set(float(freq))
         except Exception:
             pass
         try:
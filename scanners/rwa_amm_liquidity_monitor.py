@@ -26,7 +26,7 @@ def _is_rwa_pool(final_fields: Dict[str, Any]) -> bool:
         a = final_fields.get(key)
         if isinstance(a, dict):
             issuer = (a.get("issuer") or "").lower()
-            if issuer and issuer in {x.lower() for x in TRUSTLINE_WATCHED_ISSUERS}:
+            if issuer and issuer in TRUSTLINE_WATCHED_ISSUERS:
                 return True
     return False
 
@@ -222,7 +222,7 @@ async def start_xrpl_orderbook_monitor():
                                 issuers.add((base.get("issuer") or "").lower())
                             if quote.get("currency") != "XRP":
                                 issuers.add((quote.get("issuer") or "").lower())
-                            if any(i in {x.lower() for x in TRUSTLINE_WATCHED_ISSUERS} for i in issuers):
+                            if not TRUSTLINE_WATCHED_ISSUERS.isdisjoint(issuers):
                                 tags.append("RWA OB Event")
                             if any(i in gd_partners for i in issuers):
                                 tags.append("GoDark OB Shift")
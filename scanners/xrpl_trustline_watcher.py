@@ -86,7 +86,7 @@ async def start_trustline_watcher():
                         currency = limit.get("currency")
                         tags: list[str] = []
                         boost = 0.0
-                        if issuer in set(TRUSTLINE_WATCHED_ISSUERS):
+                        if issuer in TRUSTLINE_WATCHED_ISSUERS:
                             tags.append("RWA Prep")
                             boost = max(boost, 0.20)
                         if account in partners or issuer in partners:
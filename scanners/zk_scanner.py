@@ -136,8 +136,8 @@ async def start_zk_scanner():
                         "selector": _selector(input_data),
                         "calldata_entropy": _entropy(input_data),
                         "zero_value": int(val_wei == 0),
-                        "partner_from": int(from_addr in (GODARK_ETH_PARTNERS or [])),
-                        "partner_to": int(to_addr in (GODARK_ETH_PARTNERS or [])),
+                        "partner_from": int(from_addr in GODARK_ETH_PARTNERS),
+                        "partner_to": int(to_addr in GODARK_ETH_PARTNERS),
                         "usd_value": round(usd_value, 2),
                         "timestamp": int(time.time()),
                         "summary": f"ZK verify {flow.to_address[:6]}.. gas {flow.gas_used}",
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Validate app.config against the current environment (and .env) before deploying.
+
+Imports the config module once so a malformed numeric setting fails here,
+naming the variable, instead of crashing every worker at boot.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def main() -> int:
+    try:
+        import app.config as config
+    except ValueError as e:
+        print(f"[CONFIG] Invalid setting: {e}")
+        return 1
+    settings = [k for k in vars(config) if k.isupper() and not k.startswith("_")]
+    print(f"[CONFIG] {len(settings)} settings OK (APP_ENV={config.APP_ENV})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,20 +7,14 @@ Traces transactions from fingerprinted institutional wallets to detect:
 - Cross-chain obfuscation
 - Suspicious timing with equity markets
 """
-import asyncio
 import httpx
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional
-import os
 import re
-from dotenv import load_dotenv
 
-# Load .env file
-load_dotenv()
-
-# API Keys
-ETHERSCAN_API_KEY = os.getenv("ETHERSCAN_API_KEY", "")
-DUNE_API_KEY = os.getenv("DUNE_API_KEY", "")
+# API keys (app.config owns .env loading)
+from app.config import DUNE_API_KEY, ETHERSCAN_API_KEY
+from utils.rate_limit import AsyncTokenBucket
 
 print(f"[WalletTracker] Etherscan key loaded: {'YES' if ETHERSCAN_API_KEY else 'NO'}")
 print(f"[WalletTracker] Dune key loaded: {'YES' if DUNE_API_KEY else 'NO'}")
@@ -63,7 +57,9 @@ class InstitutionalWalletTracker:
         # Etherscan V2 API endpoint
         self.etherscan_base = "https://api.etherscan.io/v2/api"
         self.cache: Dict[str, Any] = {}
-        self._rate_limit_delay = 0.25  # 4 calls/sec to stay safe
+        # 4 calls/sec to stay safe: one call per 0.25s with no burst, shared by every
+        # concurrent analysis (a per-call sleep only paces calls made one at a time)
+        self._rate_limiter = AsyncTokenBucket(rate=1, period=0.25)
     
     async def get_wallet_transactions(
         self, 
@@ -88,7 +84,7 @@ class InstitutionalWalletTracker:
             params["apikey"] = ETHERSCAN_API_KEY
         
         async with httpx.AsyncClient(timeout=15) as client:
-            await asyncio.sleep(self._rate_limit_delay)
+            await self._rate_limiter.acquire()
             resp = await client.get(self.etherscan_base, params=params)
             data = resp.json()
             
@@ -117,7 +113,7 @@ class InstitutionalWalletTracker:
             params["apikey"] = ETHERSCAN_API_KEY
         
         async with httpx.AsyncClient(timeout=15) as client:
-            await asyncio.sleep(self._rate_limit_delay)
+            await self._rate_limiter.acquire()
             resp = await client.get(self.etherscan_base, params=params)
             data = resp.json()
             
@@ -144,7 +140,7 @@ class InstitutionalWalletTracker:
             params["apikey"] = ETHERSCAN_API_KEY
         
         async with httpx.AsyncClient(timeout=15) as client:
-            await asyncio.sleep(self._rate_limit_delay)
+            await self._rate_limiter.acquire()
             resp = await client.get(self.etherscan_base, params=params)
             data = resp.json()
             
@@ -0,0 +1,32 @@
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """Token bucket allowing `rate` acquisitions per `period` seconds (bursts up to `rate`)."""
+
+    def __init__(self, rate: float, period: float = 60.0):
+        self.capacity = float(rate)
+        self.fill_rate = float(rate) / period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.fill_rate)
+                self._refill()
+            self._tokens -= 1
+
+    def penalize(self, seconds: float = 0.0) -> None:
+        """Drain the bucket and hold off new tokens for `seconds` (e.g. after a 429 Retry-After)."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self.fill_rate
@@ -0,0 +1,35 @@
+"""
+orjson-backed JSON encoding with a stdlib fallback.
+
+orjson rejects integers outside the signed/unsigned 64-bit range, which raw
+on-chain amounts (value_wei, balances) routinely exceed. Those payloads fall
+back to the stdlib encoder instead of failing the request.
+"""
+import json
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+
+
+def _stdlib_dumps(content: Any) -> bytes:
+    # Same settings as starlette's JSONResponse.render
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_json(content: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, via orjson when it can encode the payload."""
+    try:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return _stdlib_dumps(content)
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """ORJSONResponse that falls back to stdlib json for payloads orjson can't encode."""
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return super().render(content)
+        except TypeError:
+            return _stdlib_dumps(content)